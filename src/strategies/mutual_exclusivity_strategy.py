@@ -4,25 +4,46 @@ import logging
 from typing import Optional, Dict, List
 from datetime import datetime
 
+# Built once at import time; get_strategy_description returns it without reallocating
+_STRATEGY_DESCRIPTION = """
+        Mutual Exclusivity Strategy:
+
+        - Only one of BOIL or KOLD positions can be held at a time
+        - When buying BOIL: Sell all KOLD positions first, then buy BOIL
+        - When buying KOLD: Sell all BOIL positions first, then buy KOLD
+        - HOLD signals result in no action
+
+        Benefits:
+        - Prevents conflicting bullish/bearish positions
+        - Maximizes capital efficiency
+        - Creates clear directional bias
+        - Reduces portfolio complexity
+        """
+
 class MutualExclusivityStrategy:
     """Trading strategy that enforces mutual exclusivity between BOIL and KOLD positions"""
     
     def __init__(self, config):
         self.config = config
         self.logger = logging.getLogger(__name__)
-        
+
+        # Supported symbol pair, resolved once so per-signal checks don't rebuild it
+        self._supported_symbols = (self.config.symbol, self.config.inverse_symbol)
+
     def execute_trade(self, signal, trader) -> Optional[Dict]:
         """Execute trade based on signal with mutual exclusivity strategy"""
         try:
-            # Check current positions for both symbols
-            boil_position = trader.get_current_position(trader.config.symbol)  # BOIL
-            kold_position = trader.get_current_position(trader.config.inverse_symbol)  # KOLD
+            # Check current positions for both symbols with one listing round-trip
+            positions = trader.get_current_positions(list(self._supported_symbols))
+            boil_position = positions[trader.config.symbol]  # BOIL
+            kold_position = positions[trader.config.inverse_symbol]  # KOLD
             
             account_info = trader.get_account_info()
             
-            self.logger.info(f"BOIL position: {boil_position}")
-            self.logger.info(f"KOLD position: {kold_position}")
-            self.logger.info(f"Account info: {account_info}")
+            # Deferred %s formatting so disabled INFO levels skip stringifying the dicts
+            self.logger.info("BOIL position: %s", boil_position)
+            self.logger.info("KOLD position: %s", kold_position)
+            self.logger.info("Account info: %s", account_info)
             
             if signal.action == 'BUY':
                 # Mutual exclusivity strategy: Buy BOIL -> Sell all KOLD, Buy KOLD -> Sell all BOIL
@@ -44,15 +65,15 @@ class MutualExclusivityStrategy:
         """Execute BOIL buy with mutual exclusivity"""
         try:
             # First, sell all KOLD positions
-            if kold_position and kold_position['qty'] > 0:
+            if kold_position and kold_position['qty'] > 0 and kold_position['side'] == 'long':
                 self.logger.info("Mutual exclusivity: Selling all KOLD positions before buying BOIL")
-                qty = int(abs(kold_position['qty']))
+                qty = kold_position['qty']
                 trader.place_market_order('sell', qty, self.config.inverse_symbol)
             
             # Close any existing BOIL position
-            if boil_position and boil_position['qty'] > 0:
+            if boil_position and boil_position['qty'] > 0 and boil_position['side'] == 'long':
                 self.logger.info("Closing existing BOIL position")
-                qty = int(abs(boil_position['qty']))
+                qty = boil_position['qty']
                 trader.place_market_order('sell', qty, self.config.symbol)
             
             # Place new BOIL order
@@ -67,15 +88,15 @@ class MutualExclusivityStrategy:
         """Execute KOLD buy with mutual exclusivity"""
         try:
             # First, sell all BOIL positions
-            if boil_position and boil_position['qty'] > 0:
+            if boil_position and boil_position['qty'] > 0 and boil_position['side'] == 'long':
                 self.logger.info("Mutual exclusivity: Selling all BOIL positions before buying KOLD")
-                qty = int(abs(boil_position['qty']))
+                qty = boil_position['qty']
                 trader.place_market_order('sell', qty, self.config.symbol)
             
             # Close any existing KOLD position
-            if kold_position and kold_position['qty'] > 0:
+            if kold_position and kold_position['qty'] > 0 and kold_position['side'] == 'long':
                 self.logger.info("Closing existing KOLD position")
-                qty = int(abs(kold_position['qty']))
+                qty = kold_position['qty']
                 trader.place_market_order('sell', qty, self.config.inverse_symbol)
             
             # Place new KOLD order
@@ -88,25 +109,12 @@ class MutualExclusivityStrategy:
     
     def get_strategy_description(self) -> str:
         """Get a description of this trading strategy"""
-        return """
-        Mutual Exclusivity Strategy:
-        
-        - Only one of BOIL or KOLD positions can be held at a time
-        - When buying BOIL: Sell all KOLD positions first, then buy BOIL
-        - When buying KOLD: Sell all BOIL positions first, then buy KOLD
-        - HOLD signals result in no action
-        
-        Benefits:
-        - Prevents conflicting bullish/bearish positions
-        - Maximizes capital efficiency
-        - Creates clear directional bias
-        - Reduces portfolio complexity
-        """
+        return _STRATEGY_DESCRIPTION
     
     def validate_signal(self, signal) -> bool:
         """Validate that the signal is compatible with this strategy"""
         if signal.action == 'BUY':
-            if signal.symbol not in [self.config.symbol, self.config.inverse_symbol]:
+            if signal.symbol not in self._supported_symbols:
                 self.logger.warning(f"Signal symbol {signal.symbol} not supported by strategy")
                 return False
         return True
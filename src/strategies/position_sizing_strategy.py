@@ -1,8 +1,23 @@
 # Calculates optimal position sizes based on signal strength and portfolio risk management.
 import logging
 from typing import Optional, Dict
+from concurrent.futures import ThreadPoolExecutor
 import math
 
+# Built once at import time; get_strategy_description returns it without reallocating
+_STRATEGY_DESCRIPTION = (
+    "Dynamic Position Sizing Strategy:\n\n"
+    "- Adjusts position sizes based on signal strength\n"
+    "- Stronger signals result in larger positions\n"
+    "- Accounts for account volatility\n"
+    "- Enforces minimum and maximum position limits\n\n"
+    "Benefits:\n"
+    "- Maximizes returns on strong signals\n"
+    "- Reduces risk during volatile periods\n"
+    "- Prevents oversized positions\n"
+    "- Adapts to market conditions"
+)
+
 class PositionSizingStrategy:
     """
     Dynamic position sizing strategy based on signal strength and volatility.
@@ -23,10 +38,20 @@ class PositionSizingStrategy:
         self.min_position_size = 100    # Minimum position size in dollars
         self.signal_strength_multiplier = 2.0  # How much signal strength affects sizing
         self.volatility_adjustment = 0.5  # How much volatility reduces position size
-        
+
+        # Supported symbol pair, resolved once so per-signal checks don't rebuild it
+        self._supported_symbols = (self.config.symbol, self.config.inverse_symbol)
+
+        # Pool for overlapping the independent Alpaca state fetches per trade
+        self._io_executor = ThreadPoolExecutor(max_workers=3)
+
+        # Precomputed scaling factors so the per-signal sizing math avoids divisions
+        self._signal_strength_scale = 1.0 / 5.0
+        self._volatility_scale = self.volatility_adjustment / 100000.0
+
     def validate_signal(self, signal) -> bool:
         """Validates the incoming signal."""
-        if signal.symbol not in [self.config.symbol, self.config.inverse_symbol]:
+        if signal.symbol not in self._supported_symbols:
             self.logger.warning(f"Strategy received signal for unsupported symbol: {signal.symbol}")
             return False
         return True
@@ -43,25 +68,32 @@ class PositionSizingStrategy:
             Optional[Dict]: The executed order details or None if no trade was made.
         """
         try:
-            # Get current positions
-            boil_position = trader.get_current_position(self.config.symbol)
-            kold_position = trader.get_current_position(self.config.inverse_symbol)
-            
-            # Get account info for volatility calculation
-            account_info = trader.get_account_info()
-            
-            self.logger.info(f"Position Sizing Strategy - BOIL position: {boil_position}")
-            self.logger.info(f"Position Sizing Strategy - KOLD position: {kold_position}")
-            self.logger.info(f"Position Sizing Strategy - Account info: {account_info}")
+            # One listing covers both positions; overlap it with the
+            # independent account round-trip
+            account_future = self._io_executor.submit(trader.get_account_info)
+            positions = trader.get_current_positions(
+                [self.config.symbol, self.config.inverse_symbol])
+
+            boil_position = positions[self.config.symbol]
+            kold_position = positions[self.config.inverse_symbol]
+            account_info = account_future.result()
+
+            # Deferred %s formatting so disabled INFO levels skip stringifying the dicts
+            self.logger.info("Position Sizing Strategy - BOIL position: %s", boil_position)
+            self.logger.info("Position Sizing Strategy - KOLD position: %s", kold_position)
+            self.logger.info("Position Sizing Strategy - Account info: %s", account_info)
             
             if signal.action == 'BUY':
                 # Calculate dynamic position size
                 position_size = self._calculate_position_size(signal, account_info)
-                
+
+                # Both directions share one code path; only the side assignment differs
                 if signal.symbol == self.config.symbol:  # Buying BOIL
-                    return self._execute_boil_buy(signal, trader, boil_position, kold_position, position_size)
+                    return self._execute_directional_buy(signal, trader, boil_position, kold_position,
+                                                         self.config.inverse_symbol, position_size)
                 elif signal.symbol == self.config.inverse_symbol:  # Buying KOLD
-                    return self._execute_kold_buy(signal, trader, boil_position, kold_position, position_size)
+                    return self._execute_directional_buy(signal, trader, kold_position, boil_position,
+                                                         self.config.symbol, position_size)
             elif signal.action == 'HOLD':
                 self.logger.info("Position Sizing Strategy - Signal indicates HOLD, no action taken")
                 return None
@@ -90,22 +122,21 @@ class PositionSizingStrategy:
             
             # Adjust for signal strength (stronger signals = larger positions)
             signal_strength = abs(signal.total_signal)
-            signal_multiplier = min(signal_strength / 5.0, self.signal_strength_multiplier)  # Cap at 2x
-            
+            signal_multiplier = min(signal_strength * self._signal_strength_scale, self.signal_strength_multiplier)  # Cap at 2x
+
             # Adjust for account volatility (higher volatility = smaller positions)
             # Use portfolio value volatility as a proxy
             portfolio_value = account_info.get('portfolio_value', 100000)
-            volatility_factor = max(0.5, 1.0 - (portfolio_value / 100000) * self.volatility_adjustment)
-            
-            # Calculate final position size
-            position_size = base_size * signal_multiplier * volatility_factor
-            
-            # Apply limits
-            position_size = max(self.min_position_size, min(position_size, self.max_position_size))
+            volatility_factor = max(0.5, 1.0 - portfolio_value * self._volatility_scale)
+
+            # Calculate final position size, clamped to the configured limits in one pass
+            position_size = min(max(base_size * signal_multiplier * volatility_factor,
+                                    self.min_position_size),
+                                self.max_position_size)
             
-            self.logger.info(f"Position Sizing Strategy - Calculated position size: ${position_size:.2f}")
-            self.logger.info(f"Position Sizing Strategy - Signal strength: {signal_strength:.3f}, Multiplier: {signal_multiplier:.3f}")
-            self.logger.info(f"Position Sizing Strategy - Volatility factor: {volatility_factor:.3f}")
+            self.logger.info("Position Sizing Strategy - Calculated position size: $%.2f", position_size)
+            self.logger.info("Position Sizing Strategy - Signal strength: %.3f, Multiplier: %.3f", signal_strength, signal_multiplier)
+            self.logger.info("Position Sizing Strategy - Volatility factor: %.3f", volatility_factor)
             
             return position_size
             
@@ -113,65 +144,31 @@ class PositionSizingStrategy:
             self.logger.error(f"Position Sizing Strategy - Error calculating position size: {e}")
             return self.base_position_size
     
-    def _execute_boil_buy(self, signal, trader, boil_position, kold_position, position_size) -> Optional[Dict]:
-        """Handles logic for buying BOIL with dynamic position sizing."""
-        # First, sell all KOLD positions
-        if kold_position and kold_position['qty'] > 0:
-            self.logger.info("Position Sizing Strategy - Selling all KOLD positions before buying BOIL")
-            qty = int(abs(kold_position['qty']))
-            trader.place_market_order('sell', qty, self.config.inverse_symbol)
-        
-        # Close any existing BOIL position
-        if boil_position and boil_position['qty'] > 0:
-            self.logger.info("Position Sizing Strategy - Closing existing BOIL position")
-            qty = int(abs(boil_position['qty']))
-            trader.place_market_order('sell', qty, self.config.symbol)
-        
-        # Calculate quantity based on dynamic position size
-        current_price = trader.get_current_price(signal.symbol)
-        if current_price:
-            qty = int(position_size / current_price)
-            self.logger.info(f"Position Sizing Strategy - Buying {qty} shares of BOIL at ${current_price:.2f} (${position_size:.2f} total)")
-            return trader.place_market_order('buy', qty, signal.symbol)
-        else:
-            self.logger.error("Position Sizing Strategy - Could not get current price for BOIL")
-            return None
-    
-    def _execute_kold_buy(self, signal, trader, boil_position, kold_position, position_size) -> Optional[Dict]:
-        """Handles logic for buying KOLD with dynamic position sizing."""
-        # First, sell all BOIL positions
-        if boil_position and boil_position['qty'] > 0:
-            self.logger.info("Position Sizing Strategy - Selling all BOIL positions before buying KOLD")
-            qty = int(abs(boil_position['qty']))
-            trader.place_market_order('sell', qty, self.config.symbol)
-        
-        # Close any existing KOLD position
-        if kold_position and kold_position['qty'] > 0:
-            self.logger.info("Position Sizing Strategy - Closing existing KOLD position")
-            qty = int(abs(kold_position['qty']))
-            trader.place_market_order('sell', qty, self.config.inverse_symbol)
-        
+    def _execute_directional_buy(self, signal, trader, own_position, opposite_position,
+                                 opposite_symbol, position_size) -> Optional[Dict]:
+        """Handles logic for buying one side of the pair with dynamic position sizing."""
+        # First, sell all positions on the opposite side
+        if opposite_position and opposite_position['qty'] > 0 and opposite_position['side'] == 'long':
+            self.logger.info(f"Position Sizing Strategy - Selling all {opposite_symbol} positions before buying {signal.symbol}")
+            qty = opposite_position['qty']
+            trader.place_market_order('sell', qty, opposite_symbol)
+
+        # Close any existing position on the buy side
+        if own_position and own_position['qty'] > 0 and own_position['side'] == 'long':
+            self.logger.info(f"Position Sizing Strategy - Closing existing {signal.symbol} position")
+            qty = own_position['qty']
+            trader.place_market_order('sell', qty, signal.symbol)
+
         # Calculate quantity based on dynamic position size
         current_price = trader.get_current_price(signal.symbol)
         if current_price:
             qty = int(position_size / current_price)
-            self.logger.info(f"Position Sizing Strategy - Buying {qty} shares of KOLD at ${current_price:.2f} (${position_size:.2f} total)")
+            self.logger.info(f"Position Sizing Strategy - Buying {qty} shares of {signal.symbol} at ${current_price:.2f} (${position_size:.2f} total)")
             return trader.place_market_order('buy', qty, signal.symbol)
         else:
-            self.logger.error("Position Sizing Strategy - Could not get current price for KOLD")
+            self.logger.error(f"Position Sizing Strategy - Could not get current price for {signal.symbol}")
             return None
     
     def get_strategy_description(self) -> str:
         """Returns a description of the strategy."""
-        return (
-            "Dynamic Position Sizing Strategy:\n\n"
-            "- Adjusts position sizes based on signal strength\n"
-            "- Stronger signals result in larger positions\n"
-            "- Accounts for account volatility\n"
-            "- Enforces minimum and maximum position limits\n\n"
-            "Benefits:\n"
-            "- Maximizes returns on strong signals\n"
-            "- Reduces risk during volatile periods\n"
-            "- Prevents oversized positions\n"
-            "- Adapts to market conditions"
-        )
+        return _STRATEGY_DESCRIPTION
@@ -2,6 +2,21 @@
 
 import logging
 from typing import Optional, Dict, List
+from datetime import datetime, timedelta
+
+# Built once at import time; get_strategy_description returns it without reallocating
+_STRATEGY_DESCRIPTION = (
+    "Signal Confirmation Strategy:\n\n"
+    "- Requires multiple consecutive signals in same direction\n"
+    "- Enforces minimum signal strength threshold\n"
+    "- Cross-validates signal consistency\n"
+    "- Uses time-based confirmation windows\n\n"
+    "Benefits:\n"
+    "- Reduces false signals\n"
+    "- Increases trade accuracy\n"
+    "- Prevents premature entries\n"
+    "- Improves risk management"
+)
 
 class SignalConfirmationStrategy:
     """
@@ -23,18 +38,35 @@ class SignalConfirmationStrategy:
         self.min_signal_strength = 3.0    # Minimum signal strength threshold
         self.confirmation_window_hours = 6  # Hours to wait for confirmation
         self.signal_history: List[Dict] = []  # Store recent signals
-        
+
+        # Supported symbol pair, resolved once so per-signal checks don't rebuild it
+        self._supported_symbols = (self.config.symbol, self.config.inverse_symbol)
+
+        # Precomputed windows so hot paths don't rebuild timedelta objects
+        self._history_window = timedelta(hours=24)
+        self._confirmation_window = timedelta(hours=self.confirmation_window_hours)
+
     def validate_signal(self, signal) -> bool:
         """Validates the incoming signal and checks for confirmation."""
-        if signal.symbol not in [self.config.symbol, self.config.inverse_symbol]:
+        if signal.symbol not in self._supported_symbols:
             self.logger.warning(f"Strategy received signal for unsupported symbol: {signal.symbol}")
             return False
         
+        # Weak signals can never confirm, so reject them before paying for the
+        # history append and pruning
+        if abs(signal.total_signal) < self.min_signal_strength:
+            self.logger.info("Signal Confirmation Strategy - Signal strength %.3f below threshold %s",
+                             abs(signal.total_signal), self.min_signal_strength)
+            return False
+
+        # Timestamp the confirmation cycle once; helpers reuse it
+        now = datetime.now()
+
         # Add signal to history
-        self._add_signal_to_history(signal)
-        
+        self._add_signal_to_history(signal, now)
+
         # Check if signal meets confirmation criteria
-        if self._is_signal_confirmed(signal):
+        if self._is_signal_confirmed(signal, now):
             self.logger.info(f"Signal Confirmation Strategy - Signal confirmed for {signal.symbol}")
             return True
         else:
@@ -53,12 +85,13 @@ class SignalConfirmationStrategy:
             Optional[Dict]: The executed order details or None if no trade was made.
         """
         try:
-            # Get current positions
-            boil_position = trader.get_current_position(self.config.symbol)
-            kold_position = trader.get_current_position(self.config.inverse_symbol)
+            # Get both positions with one listing round-trip
+            positions = trader.get_current_positions(list(self._supported_symbols))
+            boil_position = positions[self.config.symbol]
+            kold_position = positions[self.config.inverse_symbol]
             
-            self.logger.info(f"Signal Confirmation Strategy - BOIL position: {boil_position}")
-            self.logger.info(f"Signal Confirmation Strategy - KOLD position: {kold_position}")
+            self.logger.info("Signal Confirmation Strategy - BOIL position: %s", boil_position)
+            self.logger.info("Signal Confirmation Strategy - KOLD position: %s", kold_position)
             
             if signal.action == 'BUY':
                 if signal.symbol == self.config.symbol:  # Buying BOIL
@@ -76,13 +109,14 @@ class SignalConfirmationStrategy:
             self.logger.error(f"Signal Confirmation Strategy - Error during trade execution: {e}")
             return None
     
-    def _add_signal_to_history(self, signal):
+    def _add_signal_to_history(self, signal, now: datetime):
         """Adds a signal to the history for confirmation analysis."""
         signal_data = {
             'timestamp': signal.timestamp,
             'symbol': signal.symbol,
             'action': signal.action,
             'total_signal': signal.total_signal,
+            'strength': abs(signal.total_signal),  # precomputed for the consistency check
             'temperature_signal': signal.temperature_signal,
             'inventory_signal': signal.inventory_signal,
             'storm_signal': signal.storm_signal,
@@ -92,7 +126,7 @@ class SignalConfirmationStrategy:
         self.signal_history.append(signal_data)
         
         # Keep only recent signals (last 24 hours)
-        cutoff_time = datetime.now() - timedelta(hours=24)
+        cutoff_time = now - self._history_window
         self.signal_history = [
             s for s in self.signal_history 
             if s['timestamp'] > cutoff_time
@@ -100,27 +134,30 @@ class SignalConfirmationStrategy:
         
         self.logger.info(f"Signal Confirmation Strategy - Added signal to history. Total signals: {len(self.signal_history)}")
     
-    def _is_signal_confirmed(self, signal) -> bool:
+    def _is_signal_confirmed(self, signal, now: datetime) -> bool:
         """
         Checks if the current signal is confirmed based on historical signals.
-        
+
         Args:
             signal: The current trading signal object.
-        
+            now: The timestamp of the current confirmation cycle.
+
         Returns:
             bool: True if signal is confirmed, False otherwise.
         """
         try:
             # Check signal strength threshold
             if abs(signal.total_signal) < self.min_signal_strength:
-                self.logger.info(f"Signal Confirmation Strategy - Signal strength {abs(signal.total_signal):.3f} below threshold {self.min_signal_strength}")
+                self.logger.info("Signal Confirmation Strategy - Signal strength %.3f below threshold %s",
+                                 abs(signal.total_signal), self.min_signal_strength)
                 return False
-            
+
             # Check for consecutive signals in same direction
-            recent_signals = self._get_recent_signals_for_symbol(signal.symbol)
-            
+            recent_signals = self._get_recent_signals_for_symbol(signal.symbol, now)
+
             if len(recent_signals) < self.min_consecutive_signals:
-                self.logger.info(f"Signal Confirmation Strategy - Only {len(recent_signals)} recent signals, need {self.min_consecutive_signals}")
+                self.logger.info("Signal Confirmation Strategy - Only %d recent signals, need %d",
+                                 len(recent_signals), self.min_consecutive_signals)
                 return False
             
             # Check if all recent signals are in same direction
@@ -140,10 +177,10 @@ class SignalConfirmationStrategy:
             self.logger.error(f"Signal Confirmation Strategy - Error checking signal confirmation: {e}")
             return False
     
-    def _get_recent_signals_for_symbol(self, symbol) -> List[Dict]:
+    def _get_recent_signals_for_symbol(self, symbol, now: datetime) -> List[Dict]:
         """Gets recent signals for a specific symbol."""
         # Get signals from the last confirmation window
-        cutoff_time = datetime.now() - timedelta(hours=self.confirmation_window_hours)
+        cutoff_time = now - self._confirmation_window
         
         recent_signals = [
             s for s in self.signal_history 
@@ -173,29 +210,32 @@ class SignalConfirmationStrategy:
         if len(signals) < self.min_consecutive_signals:
             return False
         
-        # Check if signal strengths are consistent (not wildly different)
-        strengths = [abs(s['total_signal']) for s in signals[:self.min_consecutive_signals]]
+        # Check if signal strengths are consistent (not wildly different); the
+        # absolute strengths were precomputed when the signals entered the history
+        strengths = [s['strength'] for s in signals[:self.min_consecutive_signals]]
         avg_strength = sum(strengths) / len(strengths)
-        
-        # Allow 50% variation in signal strength
+
+        # Allow 50% variation in signal strength; compare against a precomputed
+        # bound so the loop does one subtract and one compare per element
+        max_deviation = 0.5 * avg_strength
         for strength in strengths:
-            if abs(strength - avg_strength) / avg_strength > 0.5:
+            if abs(strength - avg_strength) > max_deviation:
                 return False
-        
+
         return True
     
     def _execute_boil_buy(self, signal, trader, boil_position, kold_position) -> Optional[Dict]:
         """Handles logic for buying BOIL with confirmation."""
         # First, sell all KOLD positions
-        if kold_position and kold_position['qty'] > 0:
+        if kold_position and kold_position['qty'] > 0 and kold_position['side'] == 'long':
             self.logger.info("Signal Confirmation Strategy - Selling all KOLD positions before buying BOIL")
-            qty = int(abs(kold_position['qty']))
+            qty = kold_position['qty']
             trader.place_market_order('sell', qty, self.config.inverse_symbol)
         
         # Close any existing BOIL position
-        if boil_position and boil_position['qty'] > 0:
+        if boil_position and boil_position['qty'] > 0 and boil_position['side'] == 'long':
             self.logger.info("Signal Confirmation Strategy - Closing existing BOIL position")
-            qty = int(abs(boil_position['qty']))
+            qty = boil_position['qty']
             trader.place_market_order('sell', qty, self.config.symbol)
         
         # Place new BOIL order
@@ -206,15 +246,15 @@ class SignalConfirmationStrategy:
     def _execute_kold_buy(self, signal, trader, boil_position, kold_position) -> Optional[Dict]:
         """Handles logic for buying KOLD with confirmation."""
         # First, sell all BOIL positions
-        if boil_position and boil_position['qty'] > 0:
+        if boil_position and boil_position['qty'] > 0 and boil_position['side'] == 'long':
             self.logger.info("Signal Confirmation Strategy - Selling all BOIL positions before buying KOLD")
-            qty = int(abs(boil_position['qty']))
+            qty = boil_position['qty']
             trader.place_market_order('sell', qty, self.config.symbol)
         
         # Close any existing KOLD position
-        if kold_position and kold_position['qty'] > 0:
+        if kold_position and kold_position['qty'] > 0 and kold_position['side'] == 'long':
             self.logger.info("Signal Confirmation Strategy - Closing existing KOLD position")
-            qty = int(abs(kold_position['qty']))
+            qty = kold_position['qty']
             trader.place_market_order('sell', qty, self.config.inverse_symbol)
         
         # Place new KOLD order
@@ -224,15 +264,4 @@ class SignalConfirmationStrategy:
     
     def get_strategy_description(self) -> str:
         """Returns a description of the strategy."""
-        return (
-            "Signal Confirmation Strategy:\n\n"
-            "- Requires multiple consecutive signals in same direction\n"
-            "- Enforces minimum signal strength threshold\n"
-            "- Cross-validates signal consistency\n"
-            "- Uses time-based confirmation windows\n\n"
-            "Benefits:\n"
-            "- Reduces false signals\n"
-            "- Increases trade accuracy\n"
-            "- Prevents premature entries\n"
-            "- Improves risk management"
-        )
+        return _STRATEGY_DESCRIPTION
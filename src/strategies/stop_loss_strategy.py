@@ -1,8 +1,53 @@
 # Implements stop loss and take profit mechanisms to protect trading positions from excessive losses.
 import logging
+from dataclasses import dataclass
 from typing import Optional, Dict, List
 from datetime import datetime, timedelta
 
+# Built once at import time; get_strategy_description returns it without reallocating
+_STRATEGY_DESCRIPTION = (
+    "Stop Loss Strategy:\n\n"
+    "- Dynamic stop losses based on volatility\n"
+    "- Trailing stops for profitable positions\n"
+    "- Take profit levels at signal reversal points\n"
+    "- Risk-reward ratio optimization\n\n"
+    "Benefits:\n"
+    "- Protects against large losses\n"
+    "- Locks in profits automatically\n"
+    "- Reduces emotional trading\n"
+    "- Improves risk management"
+)
+
+def _calc_stop_loss_pct(current_price: float, default_pct: float,
+                        min_pct: float, max_pct: float) -> float:
+    """Pure stop-loss percentage math, kept as a free function of scalars."""
+    pct = default_pct
+
+    # Adjust based on volatility (simplified - in real implementation, you'd
+    # calculate actual volatility); for now, a simple heuristic based on price
+    if current_price < 20:
+        pct *= 1.2  # Tighter stop for lower-priced stocks
+    elif current_price > 50:
+        pct *= 0.8  # Wider stop for higher-priced stocks
+
+    # Apply limits
+    return min(max(pct, min_pct), max_pct)
+
+@dataclass(slots=True)
+class StopState:
+    """Stop tracking for one position; slotted attributes keep per-tick reads cheap."""
+    entry_price: float
+    stop_loss_price: float
+    take_profit_price: float
+    stop_loss_pct: float
+    order_id: Optional[str]
+    timestamp: datetime
+    trailing_activation_price: float = 0.0
+    trailing_stop: bool = False
+    trailing_stop_price: float = 0.0
+    last_checked_price: float = 0.0
+    bracket: bool = False
+
 class StopLossStrategy:
     """
     Stop loss strategy that implements automatic stop losses and take profits.
@@ -26,11 +71,14 @@ class StopLossStrategy:
         self.max_stop_loss_pct = 0.10      # 10% maximum stop loss
         
         # Track active stop losses
-        self.active_stops: Dict[str, Dict] = {}
-        
+        self.active_stops: Dict[str, StopState] = {}
+
+        # Supported symbol pair, resolved once so per-signal checks don't rebuild it
+        self._supported_symbols = (self.config.symbol, self.config.inverse_symbol)
+
     def validate_signal(self, signal) -> bool:
         """Validates the incoming signal."""
-        if signal.symbol not in [self.config.symbol, self.config.inverse_symbol]:
+        if signal.symbol not in self._supported_symbols:
             self.logger.warning(f"Strategy received signal for unsupported symbol: {signal.symbol}")
             return False
         return True
@@ -47,18 +95,22 @@ class StopLossStrategy:
             Optional[Dict]: The executed order details or None if no trade was made.
         """
         try:
-            # Get current positions
-            boil_position = trader.get_current_position(self.config.symbol)
-            kold_position = trader.get_current_position(self.config.inverse_symbol)
+            # Get both positions with one listing round-trip
+            positions = trader.get_current_positions(list(self._supported_symbols))
+            boil_position = positions[self.config.symbol]
+            kold_position = positions[self.config.inverse_symbol]
             
-            self.logger.info(f"Stop Loss Strategy - BOIL position: {boil_position}")
-            self.logger.info(f"Stop Loss Strategy - KOLD position: {kold_position}")
+            self.logger.info("Stop Loss Strategy - BOIL position: %s", boil_position)
+            self.logger.info("Stop Loss Strategy - KOLD position: %s", kold_position)
             
             if signal.action == 'BUY':
+                # Both directions share one code path; only the side assignment differs
                 if signal.symbol == self.config.symbol:  # Buying BOIL
-                    return self._execute_boil_buy(signal, trader, boil_position, kold_position)
+                    return self._execute_directional_buy(signal, trader, boil_position, kold_position,
+                                                         self.config.inverse_symbol)
                 elif signal.symbol == self.config.inverse_symbol:  # Buying KOLD
-                    return self._execute_kold_buy(signal, trader, boil_position, kold_position)
+                    return self._execute_directional_buy(signal, trader, kold_position, boil_position,
+                                                         self.config.symbol)
             elif signal.action == 'HOLD':
                 # Check existing positions for stop loss triggers
                 self._check_stop_losses(trader)
@@ -72,52 +124,29 @@ class StopLossStrategy:
             self.logger.error(f"Stop Loss Strategy - Error during trade execution: {e}")
             return None
     
-    def _execute_boil_buy(self, signal, trader, boil_position, kold_position) -> Optional[Dict]:
-        """Handles logic for buying BOIL with stop loss setup."""
-        # First, sell all KOLD positions
-        if kold_position and kold_position['qty'] > 0:
-            self.logger.info("Stop Loss Strategy - Selling all KOLD positions before buying BOIL")
-            qty = int(abs(kold_position['qty']))
-            trader.place_market_order('sell', qty, self.config.inverse_symbol)
-        
-        # Close any existing BOIL position
-        if boil_position and boil_position['qty'] > 0:
-            self.logger.info("Stop Loss Strategy - Closing existing BOIL position")
-            qty = int(abs(boil_position['qty']))
-            trader.place_market_order('sell', qty, self.config.symbol)
-        
-        # Place new BOIL order
-        qty = trader.calculate_order_quantity(signal.symbol)
-        order_result = trader.place_market_order('buy', qty, signal.symbol)
-        
-        # Set up stop loss if order was successful
-        if order_result and order_result.get('status') == 'accepted':
-            self._setup_stop_loss(signal.symbol, order_result, trader)
-        
-        return order_result
-    
-    def _execute_kold_buy(self, signal, trader, boil_position, kold_position) -> Optional[Dict]:
-        """Handles logic for buying KOLD with stop loss setup."""
-        # First, sell all BOIL positions
-        if boil_position and boil_position['qty'] > 0:
-            self.logger.info("Stop Loss Strategy - Selling all BOIL positions before buying KOLD")
-            qty = int(abs(boil_position['qty']))
-            trader.place_market_order('sell', qty, self.config.symbol)
-        
-        # Close any existing KOLD position
-        if kold_position and kold_position['qty'] > 0:
-            self.logger.info("Stop Loss Strategy - Closing existing KOLD position")
-            qty = int(abs(kold_position['qty']))
-            trader.place_market_order('sell', qty, self.config.inverse_symbol)
-        
-        # Place new KOLD order
+    def _execute_directional_buy(self, signal, trader, own_position, opposite_position,
+                                 opposite_symbol) -> Optional[Dict]:
+        """Handles logic for buying one side of the pair with stop loss setup."""
+        # Close the opposite side and any existing same-side position in one batch
+        closing_orders = []
+        if opposite_position and opposite_position['qty'] > 0 and opposite_position['side'] == 'long':
+            self.logger.info("Stop Loss Strategy - Selling all %s positions before buying %s", opposite_symbol, signal.symbol)
+            closing_orders.append(('sell', opposite_position['qty'], opposite_symbol))
+
+        if own_position and own_position['qty'] > 0 and own_position['side'] == 'long':
+            self.logger.info("Stop Loss Strategy - Closing existing %s position", signal.symbol)
+            closing_orders.append(('sell', own_position['qty'], signal.symbol))
+
+        trader.place_market_orders(closing_orders)
+
+        # Place the new buy order
         qty = trader.calculate_order_quantity(signal.symbol)
         order_result = trader.place_market_order('buy', qty, signal.symbol)
-        
+
         # Set up stop loss if order was successful
         if order_result and order_result.get('status') == 'accepted':
             self._setup_stop_loss(signal.symbol, order_result, trader)
-        
+
         return order_result
     
     def _setup_stop_loss(self, symbol: str, order_result: Dict, trader):
@@ -144,19 +173,19 @@ class StopLossStrategy:
             take_profit_price = current_price * (1 + self.take_profit_pct)
             
             # Store stop loss information
-            self.active_stops[symbol] = {
-                'entry_price': current_price,
-                'stop_loss_price': stop_loss_price,
-                'take_profit_price': take_profit_price,
-                'stop_loss_pct': stop_loss_pct,
-                'order_id': order_result.get('order_id'),
-                'timestamp': datetime.now(),
-                'trailing_stop': False
-            }
+            self.active_stops[symbol] = StopState(
+                entry_price=current_price,
+                stop_loss_price=stop_loss_price,
+                take_profit_price=take_profit_price,
+                stop_loss_pct=stop_loss_pct,
+                order_id=order_result.get('order_id'),
+                timestamp=datetime.now(),
+                trailing_activation_price=current_price * 1.05  # 5% profit threshold for trailing stop
+            )
             
-            self.logger.info(f"Stop Loss Strategy - Set up stop loss for {symbol}")
-            self.logger.info(f"Stop Loss Strategy - Entry: ${current_price:.2f}, Stop Loss: ${stop_loss_price:.2f} ({stop_loss_pct:.1%})")
-            self.logger.info(f"Stop Loss Strategy - Take Profit: ${take_profit_price:.2f} ({self.take_profit_pct:.1%})")
+            self.logger.info("Stop Loss Strategy - Set up stop loss for %s", symbol)
+            self.logger.info("Stop Loss Strategy - Entry: $%.2f, Stop Loss: $%.2f (%.1f%%)", current_price, stop_loss_price, stop_loss_pct * 100)
+            self.logger.info("Stop Loss Strategy - Take Profit: $%.2f (%.1f%%)", take_profit_price, self.take_profit_pct * 100)
             
         except Exception as e:
             self.logger.error(f"Stop Loss Strategy - Error setting up stop loss: {e}")
@@ -173,124 +202,149 @@ class StopLossStrategy:
             float: The stop loss percentage.
         """
         try:
-            # Base stop loss
-            stop_loss_pct = self.default_stop_loss_pct
-            
-            # Adjust based on volatility (simplified - in real implementation, you'd calculate actual volatility)
-            # For now, use a simple heuristic based on price
-            if current_price < 20:
-                stop_loss_pct *= 1.2  # Tighter stop for lower-priced stocks
-            elif current_price > 50:
-                stop_loss_pct *= 0.8  # Wider stop for higher-priced stocks
-            
-            # Apply limits
-            stop_loss_pct = max(self.min_stop_loss_pct, min(stop_loss_pct, self.max_stop_loss_pct))
-            
-            return stop_loss_pct
-            
+            return _calc_stop_loss_pct(current_price, self.default_stop_loss_pct,
+                                       self.min_stop_loss_pct, self.max_stop_loss_pct)
+
         except Exception as e:
             self.logger.error(f"Stop Loss Strategy - Error calculating dynamic stop loss: {e}")
             return self.default_stop_loss_pct
     
     def _check_stop_losses(self, trader):
         """Checks all active stop losses and executes if triggered."""
+        # Nothing tracked, nothing to fetch
+        if not self.active_stops:
+            return
+
         try:
-            for symbol, stop_info in list(self.active_stops.items()):
-                # Get current position
-                position = trader.get_current_position(symbol)
-                if not position or position['qty'] <= 0:
-                    # Position no longer exists, remove stop loss
-                    del self.active_stops[symbol]
+            # Bind the loop's hot references once so each iteration avoids
+            # repeated attribute lookups
+            active_stops = self.active_stops
+            logger = self.logger
+
+            # Fetch all prices for the tick in one batched call up front.
+            # The sweep below is linear, which is fine for this bot's
+            # two-ETF universe; each symbol has its own price so there is no
+            # shared extremum that an ordered structure could short-circuit on.
+            prices = trader.get_current_prices(list(active_stops))
+
+            # One listing covers every tracked symbol; per-symbol fetches each
+            # cost a full position listing on a cache miss
+            positions = trader.get_current_positions(list(active_stops))
+
+            stale = []      # symbols whose position disappeared
+            triggered = []  # (symbol, reason, qty) entries to execute after the scan
+
+            # Iterate the dict directly; removals and order placement are
+            # deferred past the loop so no defensive copy is needed
+            for symbol, stop_info in active_stops.items():
+                # Get current position from the batched snapshot
+                position = positions.get(symbol)
+                if not position or position['qty'] <= 0 or position['side'] != 'long':
+                    # Our long is gone (closed, or replaced by a short from
+                    # outside the bot), so drop the stop tracking
+                    stale.append(symbol)
                     continue
-                
-                # Get current price
-                current_price = trader.get_current_price(symbol)
+
+                # Price for this symbol from the batched snapshot
+                current_price = prices.get(symbol)
                 if not current_price:
                     continue
-                
-                # Check stop loss trigger
-                if current_price <= stop_info['stop_loss_price']:
-                    self.logger.info(f"Stop Loss Strategy - Stop loss triggered for {symbol} at ${current_price:.2f}")
-                    self._execute_stop_loss(symbol, trader, "Stop Loss")
-                    continue
-                
-                # Check take profit trigger
-                if current_price >= stop_info['take_profit_price']:
-                    self.logger.info(f"Stop Loss Strategy - Take profit triggered for {symbol} at ${current_price:.2f}")
-                    self._execute_stop_loss(symbol, trader, "Take Profit")
+
+                # An unchanged price can't change any trigger outcome, so skip
+                # the evaluation entirely on quiet ticks
+                if current_price == stop_info.last_checked_price:
                     continue
-                
-                # Check for trailing stop activation
-                if not stop_info['trailing_stop']:
-                    profit_pct = (current_price - stop_info['entry_price']) / stop_info['entry_price']
-                    if profit_pct >= 0.05:  # 5% profit threshold for trailing stop
+                stop_info.last_checked_price = current_price
+
+                # Fast path: price sits between the triggers, which is the
+                # common case on most ticks
+                if stop_info.stop_loss_price < current_price < stop_info.take_profit_price:
+                    # Check for trailing stop activation against the level
+                    # precomputed at setup, avoiding a per-tick division
+                    if not stop_info.trailing_stop and current_price >= stop_info.trailing_activation_price:
                         self._activate_trailing_stop(symbol, current_price)
-                
-                # Update trailing stop if active
-                if stop_info['trailing_stop']:
-                    self._update_trailing_stop(symbol, current_price, trader)
-                    
+
+                    # Update trailing stop if active
+                    if stop_info.trailing_stop and self._update_trailing_stop(symbol, current_price):
+                        triggered.append((symbol, "Trailing Stop", position['qty']))
+                    continue
+
+                # Slow path: one of the hard triggers fired
+                if current_price <= stop_info.stop_loss_price:
+                    logger.info("Stop Loss Strategy - Stop loss triggered for %s at $%.2f", symbol, current_price)
+                    triggered.append((symbol, "Stop Loss", position['qty']))
+                else:
+                    logger.info("Stop Loss Strategy - Take profit triggered for %s at $%.2f", symbol, current_price)
+                    triggered.append((symbol, "Take Profit", position['qty']))
+
+            for symbol in stale:
+                active_stops.pop(symbol, None)
+
+            for symbol, reason, qty in triggered:
+                self._execute_stop_loss(symbol, trader, reason, qty)
+
         except Exception as e:
             self.logger.error(f"Stop Loss Strategy - Error checking stop losses: {e}")
     
     def _activate_trailing_stop(self, symbol: str, current_price: float):
         """Activates trailing stop for a profitable position."""
         try:
-            if symbol in self.active_stops:
-                self.active_stops[symbol]['trailing_stop'] = True
-                self.active_stops[symbol]['trailing_stop_price'] = current_price * (1 - self.trailing_stop_pct)
-                self.logger.info(f"Stop Loss Strategy - Trailing stop activated for {symbol}")
-                
+            stop_info = self.active_stops.get(symbol)
+            if stop_info is None:
+                return
+
+            stop_info.trailing_stop = True
+            stop_info.trailing_stop_price = current_price * (1 - self.trailing_stop_pct)
+            self.logger.info("Stop Loss Strategy - Trailing stop activated for %s", symbol)
+
         except Exception as e:
             self.logger.error(f"Stop Loss Strategy - Error activating trailing stop: {e}")
     
-    def _update_trailing_stop(self, symbol: str, current_price: float, trader):
-        """Updates trailing stop price as position becomes more profitable."""
+    def _update_trailing_stop(self, symbol: str, current_price: float) -> bool:
+        """Updates trailing stop price and reports whether the stop was triggered."""
         try:
-            if symbol in self.active_stops:
-                stop_info = self.active_stops[symbol]
-                new_trailing_price = current_price * (1 - self.trailing_stop_pct)
-                
-                # Only update if new trailing price is higher (better for us)
-                if new_trailing_price > stop_info.get('trailing_stop_price', 0):
-                    stop_info['trailing_stop_price'] = new_trailing_price
-                    self.logger.info(f"Stop Loss Strategy - Updated trailing stop for {symbol} to ${new_trailing_price:.2f}")
-                
-                # Check if trailing stop is triggered
-                if current_price <= stop_info['trailing_stop_price']:
-                    self.logger.info(f"Stop Loss Strategy - Trailing stop triggered for {symbol} at ${current_price:.2f}")
-                    self._execute_stop_loss(symbol, trader, "Trailing Stop")
-                    
+            stop_info = self.active_stops.get(symbol)
+            if stop_info is None:
+                return False
+
+            new_trailing_price = current_price * (1 - self.trailing_stop_pct)
+
+            # Only update if new trailing price is higher (better for us)
+            if new_trailing_price > stop_info.trailing_stop_price:
+                stop_info.trailing_stop_price = new_trailing_price
+                self.logger.info("Stop Loss Strategy - Updated trailing stop for %s to $%.2f", symbol, new_trailing_price)
+
+            # Check if trailing stop is triggered
+            if current_price <= stop_info.trailing_stop_price:
+                self.logger.info("Stop Loss Strategy - Trailing stop triggered for %s at $%.2f", symbol, current_price)
+                return True
+
+            return False
+
         except Exception as e:
             self.logger.error(f"Stop Loss Strategy - Error updating trailing stop: {e}")
+            return False
     
-    def _execute_stop_loss(self, symbol: str, trader, reason: str):
+    def _execute_stop_loss(self, symbol: str, trader, reason: str, qty: Optional[int] = None):
         """Executes stop loss by selling the position."""
         try:
-            position = trader.get_current_position(symbol)
-            if position and position['qty'] > 0:
-                qty = int(abs(position['qty']))
-                self.logger.info(f"Stop Loss Strategy - Executing {reason} for {symbol}, selling {qty} shares")
+            # Use the quantity the caller already looked up; only refetch when
+            # invoked without one. qty is normalized to abs(), so only a long
+            # is sellable here - selling a short would double it
+            if qty is None:
+                position = trader.get_current_position(symbol)
+                qty = position['qty'] if position and position['side'] == 'long' else 0
+
+            if qty > 0:
+                self.logger.info("Stop Loss Strategy - Executing %s for %s, selling %s shares", reason, symbol, qty)
                 trader.place_market_order('sell', qty, symbol)
-                
+
                 # Remove from active stops
-                if symbol in self.active_stops:
-                    del self.active_stops[symbol]
-                    
+                self.active_stops.pop(symbol, None)
+
         except Exception as e:
             self.logger.error(f"Stop Loss Strategy - Error executing stop loss: {e}")
     
     def get_strategy_description(self) -> str:
         """Returns a description of the strategy."""
-        return (
-            "Stop Loss Strategy:\n\n"
-            "- Dynamic stop losses based on volatility\n"
-            "- Trailing stops for profitable positions\n"
-            "- Take profit levels at signal reversal points\n"
-            "- Risk-reward ratio optimization\n\n"
-            "Benefits:\n"
-            "- Protects against large losses\n"
-            "- Locks in profits automatically\n"
-            "- Reduces emotional trading\n"
-            "- Improves risk management"
-        )
+        return _STRATEGY_DESCRIPTION
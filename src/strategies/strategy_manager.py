@@ -1,8 +1,34 @@
 # Manages and coordinates multiple trading strategies and their execution.
 import logging
+import importlib
+from collections import deque
 from typing import Optional, Dict, List
 from datetime import datetime
 
+# Built once at import time; get_strategy_description returns it without reallocating
+_MANAGER_DESCRIPTION = (
+    "Strategy Manager:\n\n"
+    "- Manages multiple trading strategies\n"
+    "- Allows dynamic strategy switching\n"
+    "- Tracks strategy performance\n"
+    "- Provides fallback handling\n\n"
+    "Available Strategies:\n"
+    "- Mutual Exclusivity: Only one position at a time\n"
+    "- Position Sizing: Dynamic position sizing\n"
+    "- Signal Confirmation: Multiple signal validation\n"
+    "- Stop Loss: Automatic stop losses and take profits"
+)
+
+# Registry of available strategies: name -> (module, class). Modules are only
+# imported when a strategy is first used, so startup doesn't pay for all five.
+_STRATEGY_REGISTRY = {
+    'unified': ('unified_strategy', 'UnifiedStrategy'),
+    'mutual_exclusivity': ('mutual_exclusivity_strategy', 'MutualExclusivityStrategy'),
+    'position_sizing': ('position_sizing_strategy', 'PositionSizingStrategy'),
+    'signal_confirmation': ('signal_confirmation_strategy', 'SignalConfirmationStrategy'),
+    'stop_loss': ('stop_loss_strategy', 'StopLossStrategy')
+}
+
 class StrategyManager:
     """
     Manages multiple trading strategies and allows switching between them.
@@ -21,42 +47,41 @@ class StrategyManager:
         # Available strategies
         self.strategies = {}
         self.current_strategy = None
-        self.strategy_history = []
-        
+        self.strategy_history = deque(maxlen=1000)  # Bounded so long runs don't grow without limit
+
         # Initialize strategies
         self._initialize_strategies()
-        
+
+        # Strategy descriptions are static, so memoize them per strategy name
+        self._desc_cache: Dict[str, str] = {}
+
+        # Per-strategy trade counters, kept up to date in execute_trade so
+        # performance queries don't rescan the history
+        self._performance = {name: {'total_trades': 0, 'last_trade': None}
+                             for name in _STRATEGY_REGISTRY}
+
         # Set default strategy
         self.set_strategy('unified')
         
     def _initialize_strategies(self):
-        """Initializes all available strategies."""
-        try:
-            from .mutual_exclusivity_strategy import MutualExclusivityStrategy
-            from .position_sizing_strategy import PositionSizingStrategy
-            from .signal_confirmation_strategy import SignalConfirmationStrategy
-            from .stop_loss_strategy import StopLossStrategy
-            from .unified_strategy import UnifiedStrategy
-            
-            self.strategies = {
-                'unified': UnifiedStrategy(self.config),
-                'mutual_exclusivity': MutualExclusivityStrategy(self.config),
-                'position_sizing': PositionSizingStrategy(self.config),
-                'signal_confirmation': SignalConfirmationStrategy(self.config),
-                'stop_loss': StopLossStrategy(self.config)
-            }
-            
-            self.logger.info(f"Strategy Manager - Initialized {len(self.strategies)} strategies")
-            
-        except ImportError as e:
-            self.logger.error(f"Strategy Manager - Error importing strategies: {e}")
-            # Fallback to basic strategy
-            from .mutual_exclusivity_strategy import MutualExclusivityStrategy
-            self.strategies = {
-                'mutual_exclusivity': MutualExclusivityStrategy(self.config)
-            }
-            self.current_strategy = 'mutual_exclusivity'
-    
+        """Registers the available strategies; each is imported and built on first use."""
+        self.strategies = {}
+        self.logger.info(f"Strategy Manager - Registered {len(_STRATEGY_REGISTRY)} strategies")
+
+    def _get_strategy_instance(self, strategy_name: str):
+        """Gets (lazily creating) the strategy instance for a registered name."""
+        strategy = self.strategies.get(strategy_name)
+        if strategy is None and strategy_name in _STRATEGY_REGISTRY:
+            module_name, class_name = _STRATEGY_REGISTRY[strategy_name]
+            try:
+                module = importlib.import_module(f'.{module_name}', __package__)
+                strategy = getattr(module, class_name)(self.config)
+                self.strategies[strategy_name] = strategy
+                self.logger.info(f"Strategy Manager - Initialized strategy: {strategy_name}")
+            except ImportError as e:
+                self.logger.error(f"Strategy Manager - Error importing strategy {strategy_name}: {e}")
+        return strategy
+
     def set_strategy(self, strategy_name: str) -> bool:
         """
         Sets the active trading strategy.
@@ -68,7 +93,7 @@ class StrategyManager:
             bool: True if strategy was set successfully, False otherwise.
         """
         try:
-            if strategy_name not in self.strategies:
+            if strategy_name not in _STRATEGY_REGISTRY:
                 self.logger.error(f"Strategy Manager - Unknown strategy: {strategy_name}")
                 return False
             
@@ -95,8 +120,8 @@ class StrategyManager:
     
     def get_current_strategy(self):
         """Gets the current active strategy."""
-        if self.current_strategy and self.current_strategy in self.strategies:
-            return self.strategies[self.current_strategy]
+        if self.current_strategy:
+            return self._get_strategy_instance(self.current_strategy)
         return None
     
     def validate_signal(self, signal) -> bool:
@@ -135,14 +160,21 @@ class StrategyManager:
             
             # Log trade execution
             if result:
+                now = datetime.now()
                 self.strategy_history.append({
                     'strategy': self.current_strategy,
-                    'timestamp': datetime.now(),
+                    'timestamp': now,
                     'action': 'trade_executed',
                     'symbol': signal.symbol,
                     'action_type': signal.action,
                     'order_id': result.get('order_id')
                 })
+
+                # Keep the aggregate counters in step with the history
+                perf = self._performance.get(self.current_strategy)
+                if perf is not None:
+                    perf['total_trades'] += 1
+                    perf['last_trade'] = now
             
             return result
             
@@ -158,14 +190,19 @@ class StrategyManager:
                 return {
                     'strategy_name': 'None',
                     'description': 'No active strategy',
-                    'available_strategies': list(self.strategies.keys())
+                    'available_strategies': list(_STRATEGY_REGISTRY)
                 }
-            
+
+            description = self._desc_cache.get(self.current_strategy)
+            if description is None:
+                description = current_strategy.get_strategy_description()
+                self._desc_cache[self.current_strategy] = description
+
             return {
                 'strategy_name': self.current_strategy,
-                'description': current_strategy.get_strategy_description(),
-                'available_strategies': list(self.strategies.keys()),
-                'strategy_history': self.strategy_history[-10:]  # Last 10 entries
+                'description': description,
+                'available_strategies': list(_STRATEGY_REGISTRY),
+                'strategy_history': list(self.strategy_history)[-10:]  # Last 10 entries
             }
             
         except Exception as e:
@@ -178,24 +215,22 @@ class StrategyManager:
     
     def get_available_strategies(self) -> List[str]:
         """Gets list of available strategy names."""
-        return list(self.strategies.keys())
+        return list(_STRATEGY_REGISTRY)
     
     def get_strategy_performance(self) -> Dict:
         """Gets performance metrics for all strategies."""
         try:
             performance = {}
-            
-            for strategy_name, strategy in self.strategies.items():
-                # Count trades executed by this strategy
-                trades = [entry for entry in self.strategy_history 
-                         if entry.get('strategy') == strategy_name and entry.get('action') == 'trade_executed']
-                
+
+            # Read the incrementally maintained counters instead of rescanning history
+            for strategy_name in _STRATEGY_REGISTRY:
+                perf = self._performance.get(strategy_name, {'total_trades': 0, 'last_trade': None})
                 performance[strategy_name] = {
-                    'total_trades': len(trades),
-                    'last_trade': trades[-1]['timestamp'] if trades else None,
+                    'total_trades': perf['total_trades'],
+                    'last_trade': perf['last_trade'],
                     'is_active': strategy_name == self.current_strategy
                 }
-            
+
             return performance
             
         except Exception as e:
@@ -204,15 +239,4 @@ class StrategyManager:
     
     def get_strategy_description(self) -> str:
         """Returns a description of the strategy manager."""
-        return (
-            "Strategy Manager:\n\n"
-            "- Manages multiple trading strategies\n"
-            "- Allows dynamic strategy switching\n"
-            "- Tracks strategy performance\n"
-            "- Provides fallback handling\n\n"
-            "Available Strategies:\n"
-            "- Mutual Exclusivity: Only one position at a time\n"
-            "- Position Sizing: Dynamic position sizing\n"
-            "- Signal Confirmation: Multiple signal validation\n"
-            "- Stop Loss: Automatic stop losses and take profits"
-        )
+        return _MANAGER_DESCRIPTION
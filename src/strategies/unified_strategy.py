@@ -1,7 +1,28 @@
 # Implements the unified trading strategy that combines signals and manages position sizing and risk.
 import logging
+from collections import namedtuple
 from typing import Optional, Dict, List
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
+from strategies.stop_loss_strategy import StopState, _calc_stop_loss_pct
+
+# Compact history record: the confirmation check only reads the symbol, the
+# action, and the pre-computed absolute strength
+_DailySig = namedtuple('_DailySig', 'date symbol action strength')
+
+# Built once at import time; get_strategy_description returns it without reallocating
+_STRATEGY_DESCRIPTION = (
+    "Unified Trading Strategy:\n\n"
+    "Main Strategy: Follow the signal with mutual exclusivity\n"
+    "Signal Confirmation: Require 2 consecutive days of same signal\n"
+    "Dynamic Position Sizing: Adjust size based on signal strength\n"
+    "Stop Loss Protection: Automatic stop losses and take profits\n\n"
+    "Benefits:\n"
+    "- Reduces false signals with 2-day confirmation\n"
+    "- Maximizes returns with dynamic position sizing\n"
+    "- Protects against losses with stop losses\n"
+    "- Maintains clear directional bias\n"
+    "- Runs once per day for consistent execution"
+)
 
 class UnifiedStrategy:
     """
@@ -18,7 +39,7 @@ class UnifiedStrategy:
         
         # Signal confirmation parameters
         self.min_consecutive_days = 2  # Require 2 consecutive days of same signal
-        self.signal_history: List[Dict] = []  # Store daily signals
+        self.signal_history: Dict[date, _DailySig] = {}  # One stored signal per day, keyed by date
         
         # Position sizing parameters
         self.base_position_size = 1000  # Base position size in dollars
@@ -33,16 +54,20 @@ class UnifiedStrategy:
         self.min_stop_loss_pct = 0.02       # 2% minimum stop loss
         self.max_stop_loss_pct = 0.10      # 10% maximum stop loss
         
-        # Track active stop losses
-        self.active_stops: Dict[str, Dict] = {}
-        
+        # Track active stop losses; slotted StopState keeps per-tick reads cheap
+        self.active_stops: Dict[str, StopState] = {}
+
+        # Supported symbol pair, resolved once so per-signal checks don't rebuild it
+        self._supported_symbols = (self.config.symbol, self.config.inverse_symbol)
+
+
     def validate_signal(self, signal) -> bool:
         """
         Validates the incoming signal and checks for 2-day confirmation.
         Main strategy: Follow the signal if confirmed for 2 consecutive days.
         """
-        if signal.symbol not in [self.config.symbol, self.config.inverse_symbol]:
-            self.logger.warning(f"Unified Strategy - Unsupported symbol: {signal.symbol}")
+        if signal.symbol not in self._supported_symbols:
+            self.logger.warning("Unified Strategy - Unsupported symbol: %s", signal.symbol)
             return False
         
         # Add signal to daily history
@@ -50,10 +75,10 @@ class UnifiedStrategy:
         
         # Check if signal is confirmed for 2 consecutive days
         if self._is_signal_confirmed_for_two_days(signal):
-            self.logger.info(f"Unified Strategy - Signal confirmed for 2 consecutive days: {signal.symbol}")
+            self.logger.info("Unified Strategy - Signal confirmed for 2 consecutive days: %s", signal.symbol)
             return True
         else:
-            self.logger.info(f"Unified Strategy - Signal not yet confirmed for 2 consecutive days: {signal.symbol}")
+            self.logger.info("Unified Strategy - Signal not yet confirmed for 2 consecutive days: %s", signal.symbol)
             return False
     
     def execute_trade(self, signal, trader) -> Optional[Dict]:
@@ -65,28 +90,34 @@ class UnifiedStrategy:
         4. Mutual exclusivity (main strategy)
         """
         try:
-            # Get current positions
-            boil_position = trader.get_current_position(self.config.symbol)
-            kold_position = trader.get_current_position(self.config.inverse_symbol)
-            
-            self.logger.info(f"Unified Strategy - BOIL position: {boil_position}")
-            self.logger.info(f"Unified Strategy - KOLD position: {kold_position}")
-            
+            if signal.action == 'HOLD':
+                # HOLD is the common case: skip the position and account
+                # fetches entirely; the stop loss check does its own batched
+                # lookups only when stops are active
+                self._check_stop_losses(trader)
+                self.logger.info("Unified Strategy - Signal indicates HOLD, checking stop losses")
+                return None
+
+            # Get both positions with one listing round-trip
+            positions = trader.get_current_positions(list(self._supported_symbols))
+            boil_position = positions[self.config.symbol]
+            kold_position = positions[self.config.inverse_symbol]
+
+            self.logger.info("Unified Strategy - BOIL position: %s", boil_position)
+            self.logger.info("Unified Strategy - KOLD position: %s", kold_position)
+
             if signal.action == 'BUY':
                 # Calculate dynamic position size
                 account_info = trader.get_account_info()
                 position_size = self._calculate_dynamic_position_size(signal, account_info)
                 
+                # Both directions share one code path; only the side assignment differs
                 if signal.symbol == self.config.symbol:  # Buying BOIL
-                    return self._execute_boil_buy_unified(signal, trader, boil_position, kold_position, position_size)
+                    return self._execute_buy_unified(signal, trader, boil_position, kold_position,
+                                                     self.config.inverse_symbol, position_size)
                 elif signal.symbol == self.config.inverse_symbol:  # Buying KOLD
-                    return self._execute_kold_buy_unified(signal, trader, boil_position, kold_position, position_size)
-            elif signal.action == 'HOLD':
-                # Check existing positions for stop loss triggers
-                self._check_stop_losses(trader)
-                self.logger.info("Unified Strategy - Signal indicates HOLD, checking stop losses")
-                return None
-            
+                    return self._execute_buy_unified(signal, trader, kold_position, boil_position,
+                                                     self.config.symbol, position_size)
             self.logger.warning(f"Unified Strategy - Unhandled signal action: {signal.action} for symbol {signal.symbol}")
             return None
             
@@ -96,30 +127,21 @@ class UnifiedStrategy:
     
     def _add_daily_signal(self, signal):
         """Adds a daily signal to the history for confirmation analysis."""
-        signal_data = {
-            'date': datetime.now().date(),
-            'timestamp': signal.timestamp,
-            'symbol': signal.symbol,
-            'action': signal.action,
-            'total_signal': signal.total_signal,
-            'temperature_signal': signal.temperature_signal,
-            'inventory_signal': signal.inventory_signal,
-            'storm_signal': signal.storm_signal,
-            'confidence': signal.confidence
-        }
-        
-        # Remove any existing signal for today (in case bot runs multiple times)
+        # Resolve today's date once for the whole update
         today = datetime.now().date()
-        self.signal_history = [s for s in self.signal_history if s['date'] != today]
-        
-        # Add new signal
-        self.signal_history.append(signal_data)
-        
+
+        # Keying by date makes the insert replace any earlier signal from today
+        # (in case bot runs multiple times) without scanning the history
+        self.signal_history[today] = _DailySig(today, signal.symbol, signal.action,
+                                               abs(signal.total_signal))
+
         # Keep only last 7 days of history
         cutoff_date = today - timedelta(days=7)
-        self.signal_history = [s for s in self.signal_history if s['date'] >= cutoff_date]
-        
-        self.logger.info(f"Unified Strategy - Added daily signal. Total signals: {len(self.signal_history)}")
+        expired = [d for d in self.signal_history if d < cutoff_date]
+        for d in expired:
+            del self.signal_history[d]
+
+        self.logger.info("Unified Strategy - Added daily signal. Total signals: %s", len(self.signal_history))
     
     def _is_signal_confirmed_for_two_days(self, signal) -> bool:
         """
@@ -132,47 +154,42 @@ class UnifiedStrategy:
             bool: True if signal is confirmed for 2 consecutive days, False otherwise.
         """
         try:
-            # Get signals for the same symbol from the last 2 days
+            # Resolve the two relevant dates once
             today = datetime.now().date()
             yesterday = today - timedelta(days=1)
-            
-            recent_signals = [
-                s for s in self.signal_history 
-                if s['symbol'] == signal.symbol and s['date'] in [today, yesterday]
-            ]
-            
-            # Sort by date (oldest first)
-            recent_signals.sort(key=lambda x: x['date'])
-            
-            if len(recent_signals) < 2:
-                self.logger.info(f"Unified Strategy - Only {len(recent_signals)} recent signals, need 2 consecutive days")
+
+            # Direct lookups replace the old history scan; the history stores
+            # at most one signal per day
+            today_signal = self.signal_history.get(today)
+            yesterday_signal = self.signal_history.get(yesterday)
+
+            if today_signal is None or yesterday_signal is None:
+                self.logger.info("Unified Strategy - Missing signals for consecutive days")
                 return False
-            
-            # Check if we have signals for both today and yesterday
-            signal_dates = [s['date'] for s in recent_signals]
-            if today not in signal_dates or yesterday not in signal_dates:
+
+            # Both days must be for the symbol being confirmed
+            if today_signal.symbol != signal.symbol or yesterday_signal.symbol != signal.symbol:
                 self.logger.info("Unified Strategy - Missing signals for consecutive days")
                 return False
-            
+
             # Check if both signals have the same action
-            today_signal = next(s for s in recent_signals if s['date'] == today)
-            yesterday_signal = next(s for s in recent_signals if s['date'] == yesterday)
-            
-            if today_signal['action'] != yesterday_signal['action']:
+            if today_signal.action != yesterday_signal.action:
                 self.logger.info("Unified Strategy - Consecutive day signals have different actions")
                 return False
-            
+
             # Check if both signals are BUY signals (we only trade on BUY)
-            if today_signal['action'] != 'BUY':
+            if today_signal.action != 'BUY':
                 self.logger.info("Unified Strategy - Consecutive day signals are not BUY signals")
                 return False
-            
-            # Check signal consistency (not wildly different)
-            today_strength = abs(today_signal['total_signal'])
-            yesterday_strength = abs(yesterday_signal['total_signal'])
-            
-            # Allow 50% variation in signal strength
-            if abs(today_strength - yesterday_strength) / max(today_strength, yesterday_strength) > 0.5:
+
+            # Check signal consistency (not wildly different); strengths were
+            # pre-abs'd when the signals entered the history
+            today_strength = today_signal.strength
+            yesterday_strength = yesterday_signal.strength
+            
+            # Allow 50% variation in signal strength; multiplying through by
+            # the max keeps the comparison safe when both strengths are zero
+            if abs(today_strength - yesterday_strength) > 0.5 * max(today_strength, yesterday_strength):
                 self.logger.info("Unified Strategy - Consecutive day signals have inconsistent strength")
                 return False
             
@@ -194,99 +211,81 @@ class UnifiedStrategy:
         Returns:
             float: The calculated position size in dollars.
         """
-        try:
-            # Base position size
-            base_size = self.base_position_size
-            
-            # Adjust for signal strength (stronger signals = larger positions)
-            signal_strength = abs(signal.total_signal)
-            signal_multiplier = min(signal_strength / 5.0, self.signal_strength_multiplier)  # Cap at 2x
-            
-            # Adjust for account volatility (higher volatility = smaller positions)
-            portfolio_value = account_info.get('portfolio_value', 100000)
-            volatility_factor = max(0.5, 1.0 - (portfolio_value / 100000) * 0.5)
-            
-            # Calculate final position size
-            position_size = base_size * signal_multiplier * volatility_factor
-            
-            # Apply limits
-            position_size = max(self.min_position_size, min(position_size, self.max_position_size))
-            
-            self.logger.info(f"Unified Strategy - Calculated position size: ${position_size:.2f}")
-            self.logger.info(f"Unified Strategy - Signal strength: {signal_strength:.3f}, Multiplier: {signal_multiplier:.3f}")
-            self.logger.info(f"Unified Strategy - Volatility factor: {volatility_factor:.3f}")
-            
-            return position_size
-            
-        except Exception as e:
-            self.logger.error(f"Unified Strategy - Error calculating position size: {e}")
-            return self.base_position_size
-    
-    def _execute_boil_buy_unified(self, signal, trader, boil_position, kold_position, position_size) -> Optional[Dict]:
-        """Handles unified logic for buying BOIL with all strategies."""
-        # 1. Mutual exclusivity: Sell all KOLD positions first
-        if kold_position and kold_position['qty'] > 0:
-            self.logger.info("Unified Strategy - Mutual exclusivity: Selling all KOLD positions before buying BOIL")
-            qty = int(abs(kold_position['qty']))
-            trader.place_market_order('sell', qty, self.config.inverse_symbol)
-        
-        # Close any existing BOIL position
-        if boil_position and boil_position['qty'] > 0:
-            self.logger.info("Unified Strategy - Closing existing BOIL position")
-            qty = int(abs(boil_position['qty']))
-            trader.place_market_order('sell', qty, self.config.symbol)
-        
-        # 2. Dynamic position sizing: Calculate quantity based on position size
-        current_price = trader.get_current_price(signal.symbol)
-        if current_price:
-            qty = int(position_size / current_price)
-            self.logger.info(f"Unified Strategy - Buying {qty} shares of BOIL at ${current_price:.2f} (${position_size:.2f} total)")
-            order_result = trader.place_market_order('buy', qty, signal.symbol)
-            
-            # 3. Stop loss protection: Set up stop loss if order was successful
-            if order_result and order_result.get('status') == 'accepted':
-                self._setup_stop_loss(signal.symbol, order_result, trader)
-            
-            return order_result
-        else:
-            self.logger.error("Unified Strategy - Could not get current price for BOIL")
-            return None
+        # Pure arithmetic on guarded inputs; the caller's handler covers the
+        # trade path, so no local try/except is needed
+
+        # Base position size
+        base_size = self.base_position_size
+
+        # Adjust for signal strength (stronger signals = larger positions)
+        signal_strength = abs(signal.total_signal)
+        signal_multiplier = min(signal_strength / 5.0, self.signal_strength_multiplier)  # Cap at 2x
+
+        # Adjust for account volatility (higher volatility = smaller positions)
+        portfolio_value = account_info.get('portfolio_value', 100000)
+        volatility_factor = max(0.5, 1.0 - (portfolio_value / 100000) * 0.5)
+
+        # Calculate final position size, applying limits
+        position_size = base_size * signal_multiplier * volatility_factor
+        position_size = max(self.min_position_size, min(position_size, self.max_position_size))
+
+        self.logger.info("Unified Strategy - Calculated position size: $%.2f", position_size)
+        self.logger.info("Unified Strategy - Signal strength: %.3f, Multiplier: %.3f", signal_strength, signal_multiplier)
+        self.logger.info("Unified Strategy - Volatility factor: %.3f", volatility_factor)
+
+        return position_size
     
-    def _execute_kold_buy_unified(self, signal, trader, boil_position, kold_position, position_size) -> Optional[Dict]:
-        """Handles unified logic for buying KOLD with all strategies."""
-        # 1. Mutual exclusivity: Sell all BOIL positions first
-        if boil_position and boil_position['qty'] > 0:
-            self.logger.info("Unified Strategy - Mutual exclusivity: Selling all BOIL positions before buying KOLD")
-            qty = int(abs(boil_position['qty']))
-            trader.place_market_order('sell', qty, self.config.symbol)
-        
-        # Close any existing KOLD position
-        if kold_position and kold_position['qty'] > 0:
-            self.logger.info("Unified Strategy - Closing existing KOLD position")
-            qty = int(abs(kold_position['qty']))
-            trader.place_market_order('sell', qty, self.config.inverse_symbol)
-        
+    def _execute_buy_unified(self, signal, trader, own_position, opposite_position,
+                             opposite_symbol, position_size) -> Optional[Dict]:
+        """Handles unified logic for buying one side of the pair with all strategies."""
+        # 1. Mutual exclusivity: close the opposite side and any existing
+        # same-side position in one batch sharing a single fill wait
+        closing_orders = []
+        if opposite_position and opposite_position['qty'] > 0 and opposite_position['side'] == 'long':
+            self.logger.info("Unified Strategy - Mutual exclusivity: Selling all %s positions before buying %s", opposite_symbol, signal.symbol)
+            closing_orders.append(('sell', opposite_position['qty'], opposite_symbol))
+
+        if own_position and own_position['qty'] > 0 and own_position['side'] == 'long':
+            self.logger.info("Unified Strategy - Closing existing %s position", signal.symbol)
+            closing_orders.append(('sell', own_position['qty'], signal.symbol))
+
+        # Bracket exit legs from an earlier buy hold the shares being sold,
+        # so cancel them first or the closing sells get rejected
+        for _, _, close_symbol in closing_orders:
+            trader.cancel_open_orders(close_symbol)
+        trader.place_market_orders(closing_orders)
+
         # 2. Dynamic position sizing: Calculate quantity based on position size
         current_price = trader.get_current_price(signal.symbol)
         if current_price:
             qty = int(position_size / current_price)
-            self.logger.info(f"Unified Strategy - Buying {qty} shares of KOLD at ${current_price:.2f} (${position_size:.2f} total)")
-            order_result = trader.place_market_order('buy', qty, signal.symbol)
-            
-            # 3. Stop loss protection: Set up stop loss if order was successful
+            self.logger.info("Unified Strategy - Buying %s shares of %s at $%.2f ($%.2f total)", qty, signal.symbol, current_price, position_size)
+
+            # 3. Stop loss protection: attach the exit legs to the buy itself
+            # so Alpaca enforces them server-side between our daily runs
+            stop_loss_pct = self._calculate_dynamic_stop_loss(signal.symbol, current_price)
+            order_result = trader.place_market_order(
+                'buy', qty, signal.symbol,
+                stop_loss_price=current_price * (1 - stop_loss_pct),
+                take_profit_price=current_price * (1 + self.take_profit_pct)
+            )
+
+            # Record the stop state for trailing-stop handling and reconciling,
+            # reusing the price fetched for sizing instead of refetching it
             if order_result and order_result.get('status') == 'accepted':
-                self._setup_stop_loss(signal.symbol, order_result, trader)
-            
+                self._setup_stop_loss(signal.symbol, order_result, trader, entry_price=current_price)
+
             return order_result
         else:
-            self.logger.error("Unified Strategy - Could not get current price for KOLD")
+            self.logger.error("Unified Strategy - Could not get current price for %s", signal.symbol)
             return None
     
-    def _setup_stop_loss(self, symbol: str, order_result: Dict, trader):
+    def _setup_stop_loss(self, symbol: str, order_result: Dict, trader, entry_price: float = None):
         """Sets up stop loss protection for a position."""
         try:
-            # Get current price for stop loss calculation
-            current_price = trader.get_current_price(symbol)
+            # Use the price the buy path already fetched; only hit the API
+            # when called without one
+            current_price = entry_price if entry_price else trader.get_current_price(symbol)
             if not current_price:
                 self.logger.error(f"Unified Strategy - Could not get current price for {symbol}")
                 return
@@ -299,81 +298,103 @@ class UnifiedStrategy:
             take_profit_price = current_price * (1 + self.take_profit_pct)
             
             # Store stop loss information
-            self.active_stops[symbol] = {
-                'entry_price': current_price,
-                'stop_loss_price': stop_loss_price,
-                'take_profit_price': take_profit_price,
-                'stop_loss_pct': stop_loss_pct,
-                'order_id': order_result.get('order_id'),
-                'timestamp': datetime.now(),
-                'trailing_stop': False
-            }
-            
-            self.logger.info(f"Unified Strategy - Set up stop loss for {symbol}")
-            self.logger.info(f"Unified Strategy - Entry: ${current_price:.2f}, Stop Loss: ${stop_loss_price:.2f} ({stop_loss_pct:.1%})")
-            self.logger.info(f"Unified Strategy - Take Profit: ${take_profit_price:.2f} ({self.take_profit_pct:.1%})")
+            self.active_stops[symbol] = StopState(
+                entry_price=current_price,
+                stop_loss_price=stop_loss_price,
+                take_profit_price=take_profit_price,
+                stop_loss_pct=stop_loss_pct,
+                order_id=order_result.get('order_id'),
+                timestamp=datetime.now(),
+                trailing_activation_price=current_price * 1.05,  # 5% profit threshold for trailing stop
+                bracket=True  # the unified buy always attaches server-side exit legs
+            )
+            
+            self.logger.info("Unified Strategy - Set up stop loss for %s", symbol)
+            self.logger.info("Unified Strategy - Entry: $%.2f, Stop Loss: $%.2f (%.1f%%)", current_price, stop_loss_price, stop_loss_pct * 100)
+            self.logger.info("Unified Strategy - Take Profit: $%.2f (%.1f%%)", take_profit_price, self.take_profit_pct * 100)
             
         except Exception as e:
             self.logger.error(f"Unified Strategy - Error setting up stop loss: {e}")
     
     def _calculate_dynamic_stop_loss(self, symbol: str, current_price: float) -> float:
         """Calculates dynamic stop loss percentage based on volatility."""
-        try:
-            # Base stop loss
-            stop_loss_pct = self.default_stop_loss_pct
-            
-            # Adjust based on volatility (simplified)
-            if current_price < 20:
-                stop_loss_pct *= 1.2  # Tighter stop for lower-priced stocks
-            elif current_price > 50:
-                stop_loss_pct *= 0.8  # Wider stop for higher-priced stocks
-            
-            # Apply limits
-            stop_loss_pct = max(self.min_stop_loss_pct, min(stop_loss_pct, self.max_stop_loss_pct))
-            
-            return stop_loss_pct
-            
-        except Exception as e:
-            self.logger.error(f"Unified Strategy - Error calculating dynamic stop loss: {e}")
-            return self.default_stop_loss_pct
+        # Same math as the standalone stop-loss strategy; share its pure
+        # free function of scalars
+        return _calc_stop_loss_pct(current_price, self.default_stop_loss_pct,
+                                   self.min_stop_loss_pct, self.max_stop_loss_pct)
     
     def _check_stop_losses(self, trader):
         """Checks all active stop losses and executes if triggered."""
+        # Nothing tracked, nothing to fetch
+        if not self.active_stops:
+            return
+
         try:
-            for symbol, stop_info in list(self.active_stops.items()):
-                # Get current position
-                position = trader.get_current_position(symbol)
-                if not position or position['qty'] <= 0:
-                    # Position no longer exists, remove stop loss
-                    del self.active_stops[symbol]
-                    continue
-                
-                # Get current price
-                current_price = trader.get_current_price(symbol)
-                if not current_price:
+            # One batched listing covers every tracked symbol, replacing an
+            # HTTP round-trip per symbol inside the loop
+            symbols = list(self.active_stops)
+            positions = trader.get_current_positions(symbols)
+
+            # Prices only matter for entries without server-side exit legs;
+            # when everything is bracket-protected (the usual case here) the
+            # quote call would be issued and discarded every sweep
+            if any(not s.bracket for s in self.active_stops.values()):
+                prices = trader.get_current_prices(symbols)
+            else:
+                prices = {}
+
+            stale = []      # symbols whose position disappeared
+            triggered = []  # (symbol, reason, qty) entries to execute after the scan
+
+            # Iterate the dict directly; removals and order placement are
+            # deferred past the loop so no defensive copy is needed
+            for symbol, stop_info in self.active_stops.items():
+                # Get current position from the batched snapshot
+                position = positions.get(symbol)
+                if not position or position['qty'] <= 0 or position['side'] != 'long':
+                    # Our long is gone (closed, or replaced by a short from
+                    # outside the bot), so drop the stop tracking
+                    stale.append(symbol)
                     continue
-                
-                # Check stop loss trigger
-                if current_price <= stop_info['stop_loss_price']:
-                    self.logger.info(f"Unified Strategy - Stop loss triggered for {symbol} at ${current_price:.2f}")
-                    self._execute_stop_loss(symbol, trader, "Stop Loss")
+
+                # Bracket-protected symbols: Alpaca enforces the stop and take
+                # profit server-side, and the open legs hold the shares so a
+                # client-side sell would be rejected; only the stale
+                # reconciliation above applies to these entries
+                if stop_info.bracket:
                     continue
-                
-                # Check take profit trigger
-                if current_price >= stop_info['take_profit_price']:
-                    self.logger.info(f"Unified Strategy - Take profit triggered for {symbol} at ${current_price:.2f}")
-                    self._execute_stop_loss(symbol, trader, "Take Profit")
+
+                # Price for this symbol from the batched snapshot
+                current_price = prices.get(symbol)
+                if not current_price:
                     continue
                 
-                # Check for trailing stop activation
-                if not stop_info['trailing_stop']:
-                    profit_pct = (current_price - stop_info['entry_price']) / stop_info['entry_price']
-                    if profit_pct >= 0.05:  # 5% profit threshold for trailing stop
+                # Fast path: price sits between the triggers, which is the
+                # common case on most ticks
+                if stop_info.stop_loss_price < current_price < stop_info.take_profit_price:
+                    # Check for trailing stop activation against the level
+                    # precomputed at setup, avoiding a per-tick division
+                    if not stop_info.trailing_stop and current_price >= stop_info.trailing_activation_price:
                         self._activate_trailing_stop(symbol, current_price)
-                
-                # Update trailing stop if active
-                if stop_info['trailing_stop']:
-                    self._update_trailing_stop(symbol, current_price, trader)
+
+                    # Update trailing stop if active
+                    if stop_info.trailing_stop and self._update_trailing_stop(symbol, current_price):
+                        triggered.append((symbol, "Trailing Stop", position['qty']))
+                    continue
+
+                # Slow path: one of the hard triggers fired
+                if current_price <= stop_info.stop_loss_price:
+                    self.logger.info("Unified Strategy - Stop loss triggered for %s at $%.2f", symbol, current_price)
+                    triggered.append((symbol, "Stop Loss", position['qty']))
+                else:
+                    self.logger.info("Unified Strategy - Take profit triggered for %s at $%.2f", symbol, current_price)
+                    triggered.append((symbol, "Take Profit", position['qty']))
+
+            for symbol in stale:
+                self.active_stops.pop(symbol, None)
+
+            for symbol, reason, qty in triggered:
+                self._execute_stop_loss(symbol, trader, reason, qty)
                     
         except Exception as e:
             self.logger.error(f"Unified Strategy - Error checking stop losses: {e}")
@@ -382,61 +403,61 @@ class UnifiedStrategy:
         """Activates trailing stop for a profitable position."""
         try:
             if symbol in self.active_stops:
-                self.active_stops[symbol]['trailing_stop'] = True
-                self.active_stops[symbol]['trailing_stop_price'] = current_price * (1 - self.trailing_stop_pct)
-                self.logger.info(f"Unified Strategy - Trailing stop activated for {symbol}")
+                stop_info = self.active_stops[symbol]
+                stop_info.trailing_stop = True
+                stop_info.trailing_stop_price = current_price * (1 - self.trailing_stop_pct)
+                self.logger.info("Unified Strategy - Trailing stop activated for %s", symbol)
                 
         except Exception as e:
             self.logger.error(f"Unified Strategy - Error activating trailing stop: {e}")
     
-    def _update_trailing_stop(self, symbol: str, current_price: float, trader):
-        """Updates trailing stop price as position becomes more profitable."""
+    def _update_trailing_stop(self, symbol: str, current_price: float) -> bool:
+        """Updates trailing stop price and reports whether the stop was triggered."""
         try:
             if symbol in self.active_stops:
                 stop_info = self.active_stops[symbol]
                 new_trailing_price = current_price * (1 - self.trailing_stop_pct)
-                
+
                 # Only update if new trailing price is higher (better for us)
-                if new_trailing_price > stop_info.get('trailing_stop_price', 0):
-                    stop_info['trailing_stop_price'] = new_trailing_price
-                    self.logger.info(f"Unified Strategy - Updated trailing stop for {symbol} to ${new_trailing_price:.2f}")
-                
+                if new_trailing_price > stop_info.trailing_stop_price:
+                    stop_info.trailing_stop_price = new_trailing_price
+                    self.logger.info("Unified Strategy - Updated trailing stop for %s to $%.2f", symbol, new_trailing_price)
+
                 # Check if trailing stop is triggered
-                if current_price <= stop_info['trailing_stop_price']:
-                    self.logger.info(f"Unified Strategy - Trailing stop triggered for {symbol} at ${current_price:.2f}")
-                    self._execute_stop_loss(symbol, trader, "Trailing Stop")
-                    
+                if current_price <= stop_info.trailing_stop_price:
+                    self.logger.info("Unified Strategy - Trailing stop triggered for %s at $%.2f", symbol, current_price)
+                    return True
+
+            return False
+
         except Exception as e:
             self.logger.error(f"Unified Strategy - Error updating trailing stop: {e}")
+            return False
     
-    def _execute_stop_loss(self, symbol: str, trader, reason: str):
+    def _execute_stop_loss(self, symbol: str, trader, reason: str, qty: Optional[int] = None):
         """Executes stop loss by selling the position."""
         try:
-            position = trader.get_current_position(symbol)
-            if position and position['qty'] > 0:
-                qty = int(abs(position['qty']))
-                self.logger.info(f"Unified Strategy - Executing {reason} for {symbol}, selling {qty} shares")
-                trader.place_market_order('sell', qty, symbol)
-                
-                # Remove from active stops
-                if symbol in self.active_stops:
-                    del self.active_stops[symbol]
-                    
+            # Use the quantity the caller already looked up; only refetch when
+            # invoked without one. qty is normalized to abs(), so only a long
+            # is sellable here - selling a short would double it
+            if qty is None:
+                position = trader.get_current_position(symbol)
+                qty = position['qty'] if position and position['side'] == 'long' else 0
+
+            if qty > 0:
+                self.logger.info("Unified Strategy - Executing %s for %s, selling %s shares", reason, symbol, qty)
+                # Any open exit legs hold the shares; free them before selling
+                trader.cancel_open_orders(symbol)
+                order_result = trader.place_market_order('sell', qty, symbol)
+
+                # Only drop the tracking entry once the sell went through; a
+                # rejected sell leaves the position live and still unprotected
+                if order_result and order_result.get('status') not in ('rejected', 'canceled'):
+                    self.active_stops.pop(symbol, None)
+
         except Exception as e:
             self.logger.error(f"Unified Strategy - Error executing stop loss: {e}")
     
     def get_strategy_description(self) -> str:
         """Returns a description of the unified strategy."""
-        return (
-            "Unified Trading Strategy:\n\n"
-            "Main Strategy: Follow the signal with mutual exclusivity\n"
-            "Signal Confirmation: Require 2 consecutive days of same signal\n"
-            "Dynamic Position Sizing: Adjust size based on signal strength\n"
-            "Stop Loss Protection: Automatic stop losses and take profits\n\n"
-            "Benefits:\n"
-            "- Reduces false signals with 2-day confirmation\n"
-            "- Maximizes returns with dynamic position sizing\n"
-            "- Protects against losses with stop losses\n"
-            "- Maintains clear directional bias\n"
-            "- Runs once per day for consistent execution"
-        )
+        return _STRATEGY_DESCRIPTION
@@ -1,8 +1,11 @@
 # Executes trades through the Alpaca API and manages live trading operations.
 import logging
 import alpaca_trade_api as tradeapi
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from datetime import datetime
 from typing import Optional, Dict, List
+from concurrent.futures import ThreadPoolExecutor
 import time
 from strategies.strategy_manager import StrategyManager
 
@@ -24,6 +27,37 @@ class AlpacaTrader:
             api_version='v2'
         )
         
+        # Size the SDK session's connection pool and retry transient gateway
+        # errors, so the burst of calls per trade reuses one TLS connection.
+        # _session is SDK-private, so treat failure here as non-fatal.
+        try:
+            adapter = HTTPAdapter(
+                pool_connections=8,
+                pool_maxsize=16,
+                max_retries=Retry(total=3, backoff_factor=0.1,
+                                  status_forcelist=[502, 503, 504])
+            )
+            self.api._session.mount('https://', adapter)
+        except Exception as e:
+            self.logger.warning(f"Could not tune HTTP session pooling: {e}")
+
+        # Short-lived price cache: symbol -> (price, fetch_time)
+        self._price_cache: Dict[str, tuple] = {}
+        self._price_cache_ttl = 1.0  # seconds
+
+        # Short-lived position cache: symbol -> (position dict or None, fetch_time).
+        # Entries are invalidated whenever we place an order for the symbol.
+        self._position_cache: Dict[str, tuple] = {}
+        self._position_cache_ttl = 0.5  # seconds
+
+        # Pool for overlapping independent REST round-trips
+        self._io_executor = ThreadPoolExecutor(max_workers=4)
+
+        # Short-lived account snapshot: (info dict, fetch_time). Invalidated
+        # whenever an order is placed since fills change buying power.
+        self._account_cache = None
+        self._account_cache_ttl = 2.0  # seconds
+
         # Verify connection
         try:
             account = self.api.get_account()
@@ -32,65 +66,174 @@ class AlpacaTrader:
         except Exception as e:
             self.logger.error(f"Failed to connect to Alpaca API: {e}")
             raise
-    
-    def get_current_position(self, symbol: str = None) -> Optional[Dict]:
-        """Get current position for the specified symbol"""
+
+    def get_current_price(self, symbol: str = None) -> Optional[float]:
+        """Get the current price for a symbol, cached for a short TTL to avoid redundant API calls"""
         if symbol is None:
             symbol = self.config.symbol
-            
+
+        # Serve from cache if the entry is still fresh
+        cached = self._price_cache.get(symbol)
+        if cached and (time.monotonic() - cached[1]) < self._price_cache_ttl:
+            return cached[0]
+
         try:
-            position = self.api.get_position(symbol)
-            return {
-                'symbol': position.symbol,
-                'qty': float(position.qty),
-                'market_value': float(position.market_value),
-                'avg_entry_price': float(position.avg_entry_price),
-                'unrealized_pl': float(position.unrealized_pl),
-                'unrealized_plpc': float(position.unrealized_plpc)
-            }
+            bar = self.api.get_latest_bar(symbol)
+            price = float(bar.c)
+            self._price_cache[symbol] = (price, time.monotonic())
+            return price
         except Exception as e:
-            # Position might not exist
-            if "position does not exist" in str(e).lower():
-                return None
-            self.logger.error(f"Error getting position for {symbol}: {e}")
+            self.logger.error(f"Error getting current price for {symbol}: {e}")
             return None
+
+    def get_current_prices(self, symbols: List[str]) -> Dict[str, float]:
+        """Get current prices for several symbols, batching uncached ones into one API call"""
+        prices: Dict[str, float] = {}
+        missing = []
+        now = time.monotonic()
+
+        for symbol in symbols:
+            cached = self._price_cache.get(symbol)
+            if cached and (now - cached[1]) < self._price_cache_ttl:
+                prices[symbol] = cached[0]
+            else:
+                missing.append(symbol)
+
+        if not missing:
+            return prices
+
+        try:
+            bars = self.api.get_latest_bars(missing)
+            for symbol, bar in bars.items():
+                price = float(bar.c)
+                prices[symbol] = price
+                self._price_cache[symbol] = (price, now)
+        except Exception as e:
+            self.logger.error(f"Error getting batched prices for {missing}: {e}")
+            # Fall back to per-symbol fetches so one bad symbol doesn't blank the rest
+            for symbol in missing:
+                price = self.get_current_price(symbol)
+                if price is not None:
+                    prices[symbol] = price
+
+        return prices
+
+    def get_current_position(self, symbol: str = None) -> Optional[Dict]:
+        """Get current position for the specified symbol"""
+        if symbol is None:
+            symbol = self.config.symbol
+
+        # Serve from cache if the entry is still fresh; a cached None means the
+        # position was recently confirmed not to exist
+        cached = self._position_cache.get(symbol)
+        if cached and (time.monotonic() - cached[1]) < self._position_cache_ttl:
+            return cached[0]
+
+        # A listing answers "is this symbol held" without relying on the
+        # exception the SDK raises for missing positions
+        return self.get_current_positions([symbol]).get(symbol)
+
+    @staticmethod
+    def _normalize_position(position) -> Dict:
+        """Convert an SDK position entity to the dict shape strategies consume
+
+        Qty is normalized to a non-negative share count here so strategy code
+        can use it directly without int(abs(...)) conversions.
+        """
+        raw_qty = float(position.qty)
+        return {
+            'symbol': position.symbol,
+            'qty': int(abs(raw_qty)),
+            'side': 'long' if raw_qty >= 0 else 'short',
+            'market_value': float(position.market_value),
+            'avg_entry_price': float(position.avg_entry_price),
+            'unrealized_pl': float(position.unrealized_pl),
+            'unrealized_plpc': float(position.unrealized_plpc)
+        }
     
+    def get_current_positions(self, symbols: List[str]) -> Dict[str, Optional[Dict]]:
+        """Get positions for several symbols with a single list_positions call"""
+        result: Dict[str, Optional[Dict]] = {symbol: None for symbol in symbols}
+        try:
+            now = time.monotonic()
+            for position in self.api.list_positions():
+                entry = self._normalize_position(position)
+                self._position_cache[position.symbol] = (entry, now)
+                if position.symbol in result:
+                    result[position.symbol] = entry
+
+            # Requested symbols missing from the listing are confirmed flat
+            for symbol in symbols:
+                if result[symbol] is None:
+                    self._position_cache[symbol] = (None, now)
+
+        except Exception as e:
+            # Leave the entries as None without caching them, so the next
+            # call retries instead of trusting a failed listing
+            self.logger.error(f"Error listing positions: {e}")
+
+        return result
+
     def get_account_info(self) -> Dict:
-        """Get account information"""
+        """Get account information, cached for a short TTL between orders"""
+        cached = self._account_cache
+        if cached and (time.monotonic() - cached[1]) < self._account_cache_ttl:
+            return cached[0]
+
         try:
             account = self.api.get_account()
-            return {
+            info = {
                 'equity': float(account.equity),
                 'buying_power': float(account.buying_power),
                 'cash': float(account.cash),
                 'portfolio_value': float(account.portfolio_value)
             }
+            self._account_cache = (info, time.monotonic())
+            return info
         except Exception as e:
             self.logger.error(f"Error getting account info: {e}")
             return {}
     
-    def place_market_order(self, side: str, qty: int, symbol: str = None) -> Optional[Dict]:
-        """Place a market order"""
+    def place_market_order(self, side: str, qty: int, symbol: str = None,
+                           stop_loss_price: float = None,
+                           take_profit_price: float = None) -> Optional[Dict]:
+        """Place a market order, optionally as a bracket with server-side exit legs
+
+        When both stop_loss_price and take_profit_price are given, the order is
+        submitted with order_class='bracket' so Alpaca enforces the exits at the
+        exchange instead of our polling loop.
+        """
         if symbol is None:
             symbol = self.config.symbol
-            
+
+        # The order changes our holdings, so drop the cached snapshots
+        self._position_cache.pop(symbol, None)
+        self._account_cache = None
+
         try:
             self.logger.info(f"Placing {side} order for {qty} shares of {symbol}")
-            
-            order = self.api.submit_order(
+
+            order_kwargs = dict(
                 symbol=symbol,
                 qty=qty,
                 side=side,
                 type='market',
                 time_in_force='day'
             )
-            
-            # Wait for order to fill
-            time.sleep(2)
-            
-            # Get order status
-            order_status = self.api.get_order(order.id)
-            
+            if stop_loss_price is not None and take_profit_price is not None:
+                order_kwargs.update(
+                    order_class='bracket',
+                    # GTC so the exit legs survive past the entry day and
+                    # keep protecting the position between daily runs
+                    time_in_force='gtc',
+                    stop_loss={'stop_price': round(stop_loss_price, 2)},
+                    take_profit={'limit_price': round(take_profit_price, 2)}
+                )
+
+            order = self.api.submit_order(**order_kwargs)
+
+            order_status = self._wait_for_fill(order.id)
+
             result = {
                 'order_id': order.id,
                 'symbol': order.symbol,
@@ -109,16 +252,107 @@ class AlpacaTrader:
             self.logger.error(f"Error placing order: {e}")
             return None
     
+    def cancel_open_orders(self, symbol: str) -> int:
+        """Cancel any open orders for a symbol, freeing shares held by exit legs
+
+        Bracket exit legs hold the position's shares, so a client-side sell
+        of the same symbol is rejected until they are canceled.
+        """
+        canceled = 0
+        try:
+            for order in self.api.list_orders(status='open', symbols=[symbol]):
+                self.api.cancel_order(order.id)
+                canceled += 1
+            if canceled:
+                self.logger.info(f"Canceled {canceled} open orders for {symbol}")
+        except Exception as e:
+            self.logger.error(f"Error canceling open orders for {symbol}: {e}")
+        return canceled
+
+    def _wait_for_fill(self, order_id, timeout: float = 5.0):
+        """Poll an order with exponential backoff until it reaches a terminal status
+
+        Typical market orders fill well under a second, so this usually returns
+        after one or two polls instead of the fixed 2 s sleep it replaced.
+        """
+        deadline = time.monotonic() + timeout
+        poll = 0.05
+        while True:
+            order_status = self.api.get_order(order_id)
+            if order_status.status in ('filled', 'rejected', 'canceled', 'done_for_day'):
+                return order_status
+            if time.monotonic() >= deadline:
+                return order_status
+            time.sleep(poll)
+            poll = min(poll * 2, 0.5)
+
+    def place_market_orders(self, orders: List[tuple]) -> List[Optional[Dict]]:
+        """Place several market orders, sharing one fill wait instead of sleeping per order
+
+        Args:
+            orders: (side, qty, symbol) tuples, submitted in the given order.
+        """
+        if not orders:
+            return []
+
+        submitted = []
+        self._account_cache = None
+        for side, qty, symbol in orders:
+            # The order changes our holdings, so drop any cached snapshot for the symbol
+            self._position_cache.pop(symbol, None)
+
+            try:
+                self.logger.info(f"Placing {side} order for {qty} shares of {symbol}")
+                order = self.api.submit_order(
+                    symbol=symbol,
+                    qty=qty,
+                    side=side,
+                    type='market',
+                    time_in_force='day'
+                )
+                submitted.append(order)
+            except Exception as e:
+                self.logger.error(f"Error placing order: {e}")
+                submitted.append(None)
+
+        # Poll each order to a terminal status; the shared deadline keeps the
+        # whole batch bounded while typical fills return almost immediately
+        results = []
+        for order in submitted:
+            if order is None:
+                results.append(None)
+                continue
+
+            try:
+                order_status = self._wait_for_fill(order.id)
+                results.append({
+                    'order_id': order.id,
+                    'symbol': order.symbol,
+                    'qty': order.qty,
+                    'side': order.side,
+                    'status': order_status.status,
+                    'filled_qty': order_status.filled_qty,
+                    'filled_avg_price': order_status.filled_avg_price,
+                    'submitted_at': str(order_status.submitted_at)
+                })
+            except Exception as e:
+                self.logger.error(f"Error getting order status: {e}")
+                results.append(None)
+
+        return results
+
     def calculate_order_quantity(self, symbol: str) -> int:
         """Calculate order quantity based on position size and current price"""
         try:
-            # Get current price
-            bars = self.api.get_latest_bar(symbol)
-            current_price = float(bars.c)
-            
+            # Get current price via the shared TTL cache, so bursts of sizing
+            # calls for the same symbol don't refetch the latest bar
+            current_price = self.get_current_price(symbol)
+            if not current_price:
+                return 1  # Fallback to 1 share
+
             # Calculate quantity
             qty = int(self.config.position_size / current_price)
-            
+
             # Ensure minimum quantity
             qty = max(qty, 1)
             
@@ -160,31 +394,32 @@ class AlpacaTrader:
     def get_portfolio_summary(self) -> Dict:
         """Get portfolio summary"""
         try:
-            positions = self.api.list_positions()
+            # The two round-trips are independent, so overlap them
+            positions_future = self._io_executor.submit(self.api.list_positions)
             account = self.api.get_account()
-            
-            portfolio = {
+            positions = positions_future.result()
+
+            def _to_row(position):
+                # Convert each field once; current price derives from market
+                # value and quantity
+                qty = float(position.qty)
+                market_value = float(position.market_value)
+                return {
+                    'symbol': position.symbol,
+                    'qty': qty,
+                    'current_price': market_value / qty if qty else 0.0,
+                    'market_value': market_value,
+                    'unrealized_pl': float(position.unrealized_pl),
+                    'unrealized_plpc': float(position.unrealized_plpc)
+                }
+
+            return {
                 'total_value': float(account.portfolio_value),
                 'cash': float(account.cash),
                 'buying_power': float(account.buying_power),
-                'positions': []
+                'positions': [_to_row(position) for position in positions]
             }
             
-            for position in positions:
-                # Calculate current price from market value and quantity
-                current_price = float(position.market_value) / float(position.qty) if float(position.qty) != 0 else 0
-                
-                portfolio['positions'].append({
-                    'symbol': position.symbol,
-                    'qty': float(position.qty),
-                    'current_price': current_price,
-                    'market_value': float(position.market_value),
-                    'unrealized_pl': float(position.unrealized_pl),
-                    'unrealized_plpc': float(position.unrealized_plpc)
-                })
-            
-            return portfolio
-            
         except Exception as e:
             self.logger.error(f"Error getting portfolio summary: {e}")
             return {}
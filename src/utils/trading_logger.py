@@ -1,34 +1,97 @@
 # Provides centralized logging functionality for trading operations and system events.
+import atexit
 import logging
 import json
+import queue
+import threading
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from datetime import datetime
 from typing import Dict, Any
 import os
 
 class TradingLogger:
     """Comprehensive logging system for the trading bot"""
-    
+
     def __init__(self, config):
         self.config = config
         self.setup_logging()
-        
+
     def setup_logging(self):
         """Setup logging configuration"""
         # Create logs directory if it doesn't exist
         os.makedirs('logs', exist_ok=True)
-        
-        # Configure logging
-        logging.basicConfig(
-            level=getattr(logging, self.config.log_level),
-            format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.FileHandler(f'logs/{self.config.log_file}'),
-                logging.StreamHandler()
-            ]
-        )
-        
+
+        # Configure logging: the root logger only enqueues records, and a
+        # listener thread feeds the real handlers, so logger calls on the
+        # trading path never block on disk or console I/O
+        formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+        file_handler = logging.FileHandler(f'logs/{self.config.log_file}')
+        file_handler.setFormatter(formatter)
+        stream_handler = logging.StreamHandler()
+        stream_handler.setFormatter(formatter)
+
+        log_queue = queue.Queue(-1)
+        root_logger = logging.getLogger()
+        root_logger.setLevel(getattr(logging, self.config.log_level))
+        root_logger.handlers = [QueueHandler(log_queue)]
+
+        self._listener = QueueListener(log_queue, file_handler, stream_handler)
+        self._listener.start()
+        atexit.register(self._listener.stop)
+
         self.logger = logging.getLogger(__name__)
-        
+
+        # The per-event JSONL files are written by a background thread over
+        # persistent handles, so the trading path only pays for an enqueue
+        # instead of an open/write/close per event
+        self._queue = queue.SimpleQueue()
+        self._writer = threading.Thread(target=self._drain, daemon=True)
+        self._writer.start()
+        atexit.register(self._shutdown)
+
+    def _drain(self):
+        """Writes queued (stream, line) entries, keeping one handler per stream open."""
+        # Rotating handlers cap each stream at 32MB x 10 backups so the JSONL
+        # files can't grow without bound and exhaust disk
+        formatter = logging.Formatter('%(message)s')
+        handlers = {}
+        while True:
+            item = self._queue.get()
+            if item is None:
+                break
+
+            stream, line = item
+            try:
+                handler = handlers.get(stream)
+                if handler is None:
+                    handler = RotatingFileHandler(
+                        f'logs/{stream}.log',
+                        maxBytes=32 * 1024 * 1024,
+                        backupCount=10
+                    )
+                    handler.setFormatter(formatter)
+                    handlers[stream] = handler
+
+                # Emit through the handler so it manages rollover; the record
+                # carries the pre-serialized line as its message
+                record = logging.LogRecord(
+                    stream, logging.INFO, '', 0, line, None, None
+                )
+                handler.emit(record)
+            except Exception as e:
+                self.logger.error(f"Error writing {stream} log: {e}")
+
+        for handler in handlers.values():
+            try:
+                handler.close()
+            except Exception:
+                pass
+
+    def _shutdown(self):
+        """Stops the writer thread, draining anything still queued."""
+        self._queue.put(None)
+        self._writer.join(timeout=5)
+
     def log_signal(self, signal) -> None:
         """Log trading signal"""
         signal_data = {
@@ -41,38 +104,43 @@ class TradingLogger:
             'confidence': signal.confidence
         }
         
-        self.logger.info(f"TRADING SIGNAL: {json.dumps(signal_data, indent=2)}")
-        
+        # Serialize once, compactly; the same line feeds the logger and the file
+        payload = json.dumps(signal_data)
+        self.logger.info("TRADING SIGNAL: %s", payload)
+
         # Save to separate signal log file
-        with open('logs/signals.log', 'a') as f:
-            f.write(json.dumps(signal_data) + '\n')
+        self._queue.put(('signals', payload))
     
     def log_trade(self, trade_result: Dict[str, Any]) -> None:
         """Log trade execution"""
         if trade_result:
-            self.logger.info(f"TRADE EXECUTED: {json.dumps(trade_result, indent=2)}")
-            
+            trade_data = {
+                'timestamp': datetime.now().isoformat(),
+                'trade': trade_result
+            }
+
+            # Serialize once, compactly; the same line feeds the logger and the file
+            payload = json.dumps(trade_data)
+            self.logger.info("TRADE EXECUTED: %s", payload)
+
             # Save to separate trade log file
-            with open('logs/trades.log', 'a') as f:
-                trade_data = {
-                    'timestamp': datetime.now().isoformat(),
-                    'trade': trade_result
-                }
-                f.write(json.dumps(trade_data) + '\n')
+            self._queue.put(('trades', payload))
         else:
             self.logger.info("No trade executed")
     
     def log_portfolio(self, portfolio: Dict[str, Any]) -> None:
         """Log portfolio status"""
-        self.logger.info(f"PORTFOLIO STATUS: {json.dumps(portfolio, indent=2)}")
-        
+        portfolio_data = {
+            'timestamp': datetime.now().isoformat(),
+            'portfolio': portfolio
+        }
+
+        # Serialize once, compactly; the same line feeds the logger and the file
+        payload = json.dumps(portfolio_data)
+        self.logger.info("PORTFOLIO STATUS: %s", payload)
+
         # Save to separate portfolio log file
-        with open('logs/portfolio.log', 'a') as f:
-            portfolio_data = {
-                'timestamp': datetime.now().isoformat(),
-                'portfolio': portfolio
-            }
-            f.write(json.dumps(portfolio_data) + '\n')
+        self._queue.put(('portfolio', payload))
     
     def log_error(self, error: Exception, context: str = "") -> None:
         """Log errors with context"""
@@ -83,11 +151,12 @@ class TradingLogger:
             'context': context
         }
         
-        self.logger.error(f"ERROR: {json.dumps(error_data, indent=2)}")
-        
+        # Serialize once, compactly; the same line feeds the logger and the file
+        payload = json.dumps(error_data)
+        self.logger.error("ERROR: %s", payload)
+
         # Save to separate error log file
-        with open('logs/errors.log', 'a') as f:
-            f.write(json.dumps(error_data) + '\n')
+        self._queue.put(('errors', payload))
     
     def log_api_call(self, api_name: str, endpoint: str, status: str, response_time: float = None) -> None:
         """Log API calls"""
@@ -99,8 +168,9 @@ class TradingLogger:
             'response_time': response_time
         }
         
-        self.logger.info(f"API CALL: {json.dumps(api_data)}")
-        
+        # Serialize once; the same line feeds the logger and the file
+        payload = json.dumps(api_data)
+        self.logger.info("API CALL: %s", payload)
+
         # Save to separate API log file
-        with open('logs/api_calls.log', 'a') as f:
-            f.write(json.dumps(api_data) + '\n')
+        self._queue.put(('api_calls', payload))
@@ -1,5 +1,7 @@
 # Unit tests for various components of the trading bot to ensure functionality and reliability.
 import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
 
 # Add src and config directories to Python path
 project_root = os.path.dirname(os.path.dirname(__file__))
@@ -12,80 +14,86 @@ from data_sources.eia_data import EIADataFetcher
 from data_sources.noaa_data import NOAADataFetcher
 from signals.signal_processor import SignalProcessor
 
-    # Test weather data fetching
-    def test_weather_data(self):
+# Test weather data fetching
+def test_weather_data():
     print("Testing Weather Data Fetching...")
     config = TradingConfig()
     weather_fetcher = WeatherDataFetcher(config)
-    
+
     signal = weather_fetcher.get_regional_hdd_signal()
     print(f"Weather signal: {signal:.3f}")
     return signal
 
-    # Test EIA data fetching
-    def test_eia_data(self):
+# Test EIA data fetching
+def test_eia_data():
     print("\nTesting EIA Data Fetching...")
     config = TradingConfig()
     eia_fetcher = EIADataFetcher(config)
-    
+
     signal = eia_fetcher.calculate_inventory_signal()
     print(f"Inventory signal: {signal:.3f}")
     return signal
 
-    # Test NOAA data fetching
-    def test_noaa_data(self):
+# Test NOAA data fetching
+def test_noaa_data():
     print("\nTesting NOAA Data Fetching...")
     config = TradingConfig()
     noaa_fetcher = NOAADataFetcher(config)
-    
+
     signal = noaa_fetcher.calculate_storm_signal()
     print(f"Storm signal: {signal:.3f}")
     return signal
 
-    # Test signal processing
-    def test_signal_processing(self):
+# Test signal processing
+def test_signal_processing():
     print("\nTesting Signal Processing...")
     config = TradingConfig()
     processor = SignalProcessor(config)
-    
+
     # Test with sample signals
     temp_signal = 0.2
     inventory_signal = -0.1
     storm_signal = 0.05
-    
+
     trading_signal = processor.create_trading_signal(
         temp_signal, inventory_signal, storm_signal
     )
-    
+
     print(f"Temperature signal: {trading_signal.temperature_signal:.3f}")
     print(f"Inventory signal: {trading_signal.inventory_signal:.3f}")
     print(f"Storm signal: {trading_signal.storm_signal:.3f}")
     print(f"Total signal: {trading_signal.total_signal:.3f}")
     print(f"Action: {trading_signal.action}")
     print(f"Confidence: {trading_signal.confidence:.3f}")
-    
+
     return trading_signal
 
-    # Run all tests
-    def main(self):
+# Run all tests
+def main():
     print("NATGAS TRADER - Component Tests")
     print("=" * 50)
-    
+
     try:
-        # Test individual components
-        weather_signal = test_weather_data()
-        inventory_signal = test_eia_data()
-        storm_signal = test_noaa_data()
-        
+        # The three fetchers hit independent remote APIs, so run them
+        # concurrently; total wall time drops to the slowest fetch
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            weather_future = executor.submit(test_weather_data)
+            inventory_future = executor.submit(test_eia_data)
+            storm_future = executor.submit(test_noaa_data)
+
+            weather_signal = weather_future.result()
+            inventory_signal = inventory_future.result()
+            storm_signal = storm_future.result()
+
         # Test signal processing with real data
         print("\nTesting Signal Processing with Real Data...")
         config = TradingConfig()
         processor = SignalProcessor(config)
-        
+
         trading_signal = processor.create_trading_signal(
             weather_signal, inventory_signal, storm_signal
         )
-        
+
         print(f"\nFinal Trading Signal:")
         print(f"  Temperature: {trading_signal.temperature_signal:.3f}")
         print(f"  Inventory: {trading_signal.inventory_signal:.3f}")
@@ -93,9 +101,9 @@ from signals.signal_processor import SignalProcessor
         print(f"  Total: {trading_signal.total_signal:.3f}")
         print(f"  Action: {trading_signal.action}")
         print(f"  Confidence: {trading_signal.confidence:.3f}")
-        
+
         print("\nAll tests completed successfully!")
-        
+
     except Exception as e:
         print(f"Test failed with error: {e}")
         sys.exit(1)